@@ -8,23 +8,38 @@ import plotly.graph_objects as go
 import plotly.express as px
 import io
 from datetime import datetime
-import csv
-from io import StringIO
+from io import StringIO, BytesIO
 import json
+import hashlib
+import importlib.util
 
-# Executive Report Dependencies
+# Executive Report Dependencies (imported lazily when a report is built)
+REPORT_DEPENDENCIES_AVAILABLE = importlib.util.find_spec('reportlab') is not None
+
+# Optional fused array arithmetic for the Monte Carlo simulation
 try:
-    from reportlab.lib import colors
-    from reportlab.lib.pagesizes import letter, A4
-    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak, Image
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib.units import inch
-    from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT, TA_JUSTIFY
-    import matplotlib.pyplot as plt
-    from io import BytesIO
-    REPORT_DEPENDENCIES_AVAILABLE = True
+    import numexpr as ne
+    NUMEXPR_AVAILABLE = True
 except ImportError:
-    REPORT_DEPENDENCIES_AVAILABLE = False
+    NUMEXPR_AVAILABLE = False
+
+# Optional JIT compilation for the monthly payback search
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Optional fast JSON serialization for configuration export/import
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional Parquet engine for compact configuration export/import
+PARQUET_AVAILABLE = (importlib.util.find_spec('pyarrow') is not None or
+                     importlib.util.find_spec('fastparquet') is not None)
 
 # Set page configuration
 st.set_page_config(page_title="Autonomous IT Operations BVA Tool", layout="wide")
@@ -33,26 +48,27 @@ st.set_page_config(page_title="Autonomous IT Operations BVA Tool", layout="wide"
 
 def validate_inputs():
     """Validate user inputs and return warnings/errors"""
+    ss = st.session_state
     warnings = []
     errors = []
     
     # Get values from session state
-    platform_cost = st.session_state.get('platform_cost', 0)
-    services_cost = st.session_state.get('services_cost', 0)
-    alert_reduction_pct = st.session_state.get('alert_reduction_pct', 0)
-    incident_reduction_pct = st.session_state.get('incident_reduction_pct', 0)
-    mttr_improvement_pct = st.session_state.get('mttr_improvement_pct', 0)
-    alert_volume = st.session_state.get('alert_volume', 0)
-    alert_ftes = st.session_state.get('alert_ftes', 0)
-    incident_volume = st.session_state.get('incident_volume', 0)
-    incident_ftes = st.session_state.get('incident_ftes', 0)
-    working_hours_per_fte_per_year = st.session_state.get('working_hours_per_fte_per_year', 2000)
-    avg_alert_triage_time = st.session_state.get('avg_alert_triage_time', 0)
-    avg_incident_triage_time = st.session_state.get('avg_incident_triage_time', 0)
-    billing_start_month = st.session_state.get('billing_start_month', 1)
-    implementation_delay_months = st.session_state.get('implementation_delay', 6)
-    benefits_ramp_up_months = st.session_state.get('benefits_ramp_up', 3)
-    evaluation_years = st.session_state.get('evaluation_years', 3)
+    platform_cost = ss.get('platform_cost', 0)
+    services_cost = ss.get('services_cost', 0)
+    alert_reduction_pct = ss.get('alert_reduction_pct', 0)
+    incident_reduction_pct = ss.get('incident_reduction_pct', 0)
+    mttr_improvement_pct = ss.get('mttr_improvement_pct', 0)
+    alert_volume = ss.get('alert_volume', 0)
+    alert_ftes = ss.get('alert_ftes', 0)
+    incident_volume = ss.get('incident_volume', 0)
+    incident_ftes = ss.get('incident_ftes', 0)
+    working_hours_per_fte_per_year = ss.get('working_hours_per_fte_per_year', 2000)
+    avg_alert_triage_time = ss.get('avg_alert_triage_time', 0)
+    avg_incident_triage_time = ss.get('avg_incident_triage_time', 0)
+    billing_start_month = ss.get('billing_start_month', 1)
+    implementation_delay_months = ss.get('implementation_delay', 6)
+    benefits_ramp_up_months = ss.get('benefits_ramp_up', 3)
+    evaluation_years = ss.get('evaluation_years', 3)
     
     # Check for negative values where they don't make sense
     if platform_cost < 0:
@@ -104,16 +120,17 @@ def validate_inputs():
 
 def check_calculation_health():
     """Check if calculations produce reasonable results"""
+    ss = st.session_state
     issues = []
     
     # Get values from session state with defaults
-    alert_fte_percentage = st.session_state.get('alert_fte_percentage', 0)
-    incident_fte_percentage = st.session_state.get('incident_fte_percentage', 0)
-    total_annual_benefits = st.session_state.get('total_annual_benefits', 0)
-    avg_alert_fte_salary = st.session_state.get('avg_alert_fte_salary', 0)
-    alert_ftes = st.session_state.get('alert_ftes', 0)
-    avg_incident_fte_salary = st.session_state.get('avg_incident_fte_salary', 0)
-    incident_ftes = st.session_state.get('incident_ftes', 0)
+    alert_fte_percentage = ss.get('alert_fte_percentage', 0)
+    incident_fte_percentage = ss.get('incident_fte_percentage', 0)
+    total_annual_benefits = ss.get('total_annual_benefits', 0)
+    avg_alert_fte_salary = ss.get('avg_alert_fte_salary', 0)
+    alert_ftes = ss.get('alert_ftes', 0)
+    avg_incident_fte_salary = ss.get('avg_incident_fte_salary', 0)
+    incident_ftes = ss.get('incident_ftes', 0)
     
     # Check if time allocation exceeds 100%
     if alert_fte_percentage > 1.0:
@@ -132,27 +149,42 @@ def check_calculation_health():
 
 def detect_calculation_red_flags():
     """Detect unrealistic calculations and provide detailed reasoning"""
+    ss = st.session_state
+    
+    # Get values from session state
+    return build_calculation_red_flags(
+        cost_per_alert=ss.get('cost_per_alert', 0),
+        cost_per_incident=ss.get('cost_per_incident', 0),
+        alert_fte_percentage=ss.get('alert_fte_percentage', 0),
+        incident_fte_percentage=ss.get('incident_fte_percentage', 0),
+        total_annual_benefits=ss.get('total_annual_benefits', 0),
+        alert_ftes=ss.get('alert_ftes', 0),
+        incident_ftes=ss.get('incident_ftes', 0),
+        avg_alert_fte_salary=ss.get('avg_alert_fte_salary', 0),
+        avg_incident_fte_salary=ss.get('avg_incident_fte_salary', 0),
+        alert_fte_time_pct=ss.get('alert_fte_time_pct', 100),
+        incident_fte_time_pct=ss.get('incident_fte_time_pct', 100),
+        alert_volume=ss.get('alert_volume', 0),
+        incident_volume=ss.get('incident_volume', 0),
+        avg_alert_triage_time=ss.get('avg_alert_triage_time', 0),
+        avg_incident_triage_time=ss.get('avg_incident_triage_time', 0),
+        working_hours_per_fte_per_year=ss.get('working_hours_per_fte_per_year', 2000),
+        currency_symbol=ss.get('currency', '$')
+    )
+
+@st.cache_data(show_spinner=False)
+def build_calculation_red_flags(cost_per_alert, cost_per_incident, alert_fte_percentage, incident_fte_percentage,
+                                total_annual_benefits, alert_ftes, incident_ftes, avg_alert_fte_salary,
+                                avg_incident_fte_salary, alert_fte_time_pct, incident_fte_time_pct, alert_volume,
+                                incident_volume, avg_alert_triage_time, avg_incident_triage_time,
+                                working_hours_per_fte_per_year, currency_symbol):
+    """Build the red flags and warnings, with their reasoning text, from scalar inputs (cached across reruns)"""
     red_flags = []
     warnings = []
     
-    # Get values from session state
-    cost_per_alert = st.session_state.get('cost_per_alert', 0)
-    cost_per_incident = st.session_state.get('cost_per_incident', 0)
-    alert_fte_percentage = st.session_state.get('alert_fte_percentage', 0)
-    incident_fte_percentage = st.session_state.get('incident_fte_percentage', 0)
-    total_annual_benefits = st.session_state.get('total_annual_benefits', 0)
-    alert_ftes = st.session_state.get('alert_ftes', 0)
-    incident_ftes = st.session_state.get('incident_ftes', 0)
-    avg_alert_fte_salary = st.session_state.get('avg_alert_fte_salary', 0)
-    avg_incident_fte_salary = st.session_state.get('avg_incident_fte_salary', 0)
-    alert_fte_time_pct = st.session_state.get('alert_fte_time_pct', 100)
-    incident_fte_time_pct = st.session_state.get('incident_fte_time_pct', 100)
-    alert_volume = st.session_state.get('alert_volume', 0)
-    incident_volume = st.session_state.get('incident_volume', 0)
-    avg_alert_triage_time = st.session_state.get('avg_alert_triage_time', 0)
-    avg_incident_triage_time = st.session_state.get('avg_incident_triage_time', 0)
-    working_hours_per_fte_per_year = st.session_state.get('working_hours_per_fte_per_year', 2000)
-    currency_symbol = st.session_state.get('currency', '$')
+    # Utilization percentages quoted across several flags, formatted once
+    alert_utilization_text = f"{alert_fte_percentage*100:.1f}%"
+    incident_utilization_text = f"{incident_fte_percentage*100:.1f}%"
     
     # Red Flag 1: Extremely high cost per alert/incident
     if cost_per_alert > 100:
@@ -205,12 +237,14 @@ def detect_calculation_red_flags():
     
     # Red Flag 2: FTE utilization over 100%
     if alert_fte_percentage > 1.0:
+        alert_hours_needed_text = f"{alert_volume * avg_alert_triage_time / 60:,.0f}"
+        alert_hours_allocated_text = f"{(alert_ftes * working_hours_per_fte_per_year * alert_fte_time_pct / 100.0):,.0f}"
         reasoning_text = f"""Your alert workload requires more time than you've allocated.
 
 **The Math Breakdown:**
-- **Time Needed for Workload:** {alert_volume:,} alerts × {avg_alert_triage_time} mins/alert = {alert_volume * avg_alert_triage_time / 60:,.0f} hours/year
-- **FTE Time Allocated to Alerts:** {alert_ftes} FTEs × {working_hours_per_fte_per_year:,.0f} hours/FTE × {alert_fte_time_pct}% = **{(alert_ftes * working_hours_per_fte_per_year * alert_fte_time_pct / 100.0):,.0f} hours/year**
-- **Utilization of Allocated Time:** {alert_volume * avg_alert_triage_time / 60:,.0f} hours ÷ {(alert_ftes * working_hours_per_fte_per_year * alert_fte_time_pct / 100.0):,.0f} hours = **{alert_fte_percentage*100:.1f}%**
+- **Time Needed for Workload:** {alert_volume:,} alerts × {avg_alert_triage_time} mins/alert = {alert_hours_needed_text} hours/year
+- **FTE Time Allocated to Alerts:** {alert_ftes} FTEs × {working_hours_per_fte_per_year:,.0f} hours/FTE × {alert_fte_time_pct}% = **{alert_hours_allocated_text} hours/year**
+- **Utilization of Allocated Time:** {alert_hours_needed_text} hours ÷ {alert_hours_allocated_text} hours = **{alert_utilization_text}**
 
 **To fix this, you need to:**
 - Increase the **% of FTE Time on Alerts** (currently {alert_fte_time_pct}%)
@@ -220,18 +254,20 @@ def detect_calculation_red_flags():
         
         red_flags.append({
             'type': 'Over-allocated Alert FTEs',
-            'value': f"{alert_fte_percentage*100:.1f}% Utilization of Allocated Time",
+            'value': f"{alert_utilization_text} Utilization of Allocated Time",
             'reasoning': reasoning_text,
             'severity': 'critical'
         })
     
     if incident_fte_percentage > 1.0:
+        incident_hours_needed_text = f"{incident_volume * avg_incident_triage_time / 60:,.0f}"
+        incident_hours_allocated_text = f"{(incident_ftes * working_hours_per_fte_per_year * incident_fte_time_pct / 100.0):,.0f}"
         reasoning_text = f"""Your incident workload requires more time than you've allocated.
 
 **The Math Breakdown:**
-- **Time Needed for Workload:** {incident_volume:,} incidents × {avg_incident_triage_time} mins/incident = {incident_volume * avg_incident_triage_time / 60:,.0f} hours/year
-- **FTE Time Allocated to Incidents:** {incident_ftes} FTEs × {working_hours_per_fte_per_year:,.0f} hours/FTE × {incident_fte_time_pct}% = **{(incident_ftes * working_hours_per_fte_per_year * incident_fte_time_pct / 100.0):,.0f} hours/year**
-- **Utilization of Allocated Time:** {incident_volume * avg_incident_triage_time / 60:,.0f} hours ÷ {(incident_ftes * working_hours_per_fte_per_year * incident_fte_time_pct / 100.0):,.0f} hours = **{incident_fte_percentage*100:.1f}%**
+- **Time Needed for Workload:** {incident_volume:,} incidents × {avg_incident_triage_time} mins/incident = {incident_hours_needed_text} hours/year
+- **FTE Time Allocated to Incidents:** {incident_ftes} FTEs × {working_hours_per_fte_per_year:,.0f} hours/FTE × {incident_fte_time_pct}% = **{incident_hours_allocated_text} hours/year**
+- **Utilization of Allocated Time:** {incident_hours_needed_text} hours ÷ {incident_hours_allocated_text} hours = **{incident_utilization_text}**
 
 **To fix this, you need to:**
 - Increase the **% of FTE Time on Incidents** (currently {incident_fte_time_pct}%)
@@ -241,7 +277,7 @@ def detect_calculation_red_flags():
 
         red_flags.append({
             'type': 'Over-allocated Incident FTEs',
-            'value': f"{incident_fte_percentage*100:.1f}% Utilization of Allocated Time",
+            'value': f"{incident_utilization_text} Utilization of Allocated Time",
             'reasoning': reasoning_text,
             'severity': 'critical'
         })
@@ -275,7 +311,7 @@ def detect_calculation_red_flags():
     
     # Red Flag 4: Extremely low FTE utilization
     if alert_fte_percentage > 0 and alert_fte_percentage < 0.1:
-        reasoning_text = f"""Your alert workload only uses {alert_fte_percentage*100:.1f}% of the FTE time you've allocated for alerts.
+        reasoning_text = f"""Your alert workload only uses {alert_utilization_text} of the FTE time you've allocated for alerts.
 
 **This suggests:**
 - You may have allocated too much FTE time for this task
@@ -285,13 +321,13 @@ def detect_calculation_red_flags():
         
         warnings.append({
             'type': 'Very Low Alert FTE Utilization',
-            'value': f"{alert_fte_percentage*100:.1f}%",
+            'value': alert_utilization_text,
             'reasoning': reasoning_text,
             'severity': 'low'
         })
     
     if incident_fte_percentage > 0 and incident_fte_percentage < 0.1:
-        reasoning_text = f"""Your incident workload only uses {incident_fte_percentage*100:.1f}% of the FTE time you've allocated for incidents.
+        reasoning_text = f"""Your incident workload only uses {incident_utilization_text} of the FTE time you've allocated for incidents.
 
 **This suggests:**
 - You may have allocated too much FTE time for this task
@@ -301,7 +337,7 @@ def detect_calculation_red_flags():
         
         warnings.append({
             'type': 'Very Low Incident FTE Utilization',
-            'value': f"{incident_fte_percentage*100:.1f}%",
+            'value': incident_utilization_text,
             'reasoning': reasoning_text,
             'severity': 'low'
         })
@@ -335,8 +371,15 @@ def detect_calculation_red_flags():
     
     return red_flags, warnings
 
+# How each red flag severity is rendered: (Streamlit element, icon)
+RED_FLAG_DISPLAY = {
+    'critical': (st.error, "🔴"),
+    'high': (st.error, "🟠"),
+}
+DEFAULT_RED_FLAG_DISPLAY = (st.warning, "🟡")
+
 def show_calculation_reasoning_dashboard():
-    """Display a comprehensive dashboard showing calculation reasoning"""
+    """Display a comprehensive dashboard showing calculation reasoning; returns the detected (red_flags, warnings)"""
     st.subheader("🔍 Calculation Reasoning & Data Quality Dashboard")
     
     # Run red flag detection
@@ -356,12 +399,8 @@ def show_calculation_reasoning_dashboard():
     with reasoning_tabs[0]:
         if red_flags:
             for flag in red_flags:
-                if flag['severity'] == 'critical':
-                    st.error(f"🔴 **{flag['type']}**: {flag['value']}")
-                elif flag['severity'] == 'high':
-                    st.error(f"🟠 **{flag['type']}**: {flag['value']}")
-                else:
-                    st.warning(f"🟡 **{flag['type']}**: {flag['value']}")
+                show_flag, icon = RED_FLAG_DISPLAY.get(flag['severity'], DEFAULT_RED_FLAG_DISPLAY)
+                show_flag(f"{icon} **{flag['type']}**: {flag['value']}")
                 
                 with st.expander(f"See reasoning for {flag['type']}"):
                     st.markdown(flag['reasoning'])
@@ -382,28 +421,31 @@ def show_calculation_reasoning_dashboard():
     
     with reasoning_tabs[3]:
         show_data_quality_score(red_flags, warnings)
+    
+    return red_flags, warnings
 
 def show_detailed_calculation_breakdown():
     """Show step-by-step calculation breakdown"""
+    ss = st.session_state
     st.markdown("### Step-by-Step Calculation Breakdown")
     
     # Get values from session state
-    cost_per_alert = st.session_state.get('cost_per_alert', 0)
-    cost_per_incident = st.session_state.get('cost_per_incident', 0)
-    alert_volume = st.session_state.get('alert_volume', 0)
-    incident_volume = st.session_state.get('incident_volume', 0)
-    alert_ftes = st.session_state.get('alert_ftes', 0)
-    incident_ftes = st.session_state.get('incident_ftes', 0)
-    alert_fte_time_pct = st.session_state.get('alert_fte_time_pct', 100)
-    incident_fte_time_pct = st.session_state.get('incident_fte_time_pct', 100)
-    avg_alert_triage_time = st.session_state.get('avg_alert_triage_time', 0)
-    avg_incident_triage_time = st.session_state.get('avg_incident_triage_time', 0)
-    avg_alert_fte_salary = st.session_state.get('avg_alert_fte_salary', 0)
-    avg_incident_fte_salary = st.session_state.get('avg_incident_fte_salary', 0)
-    working_hours_per_fte_per_year = st.session_state.get('working_hours_per_fte_per_year', 2000)
-    alert_fte_percentage = st.session_state.get('alert_fte_percentage', 0)
-    incident_fte_percentage = st.session_state.get('incident_fte_percentage', 0)
-    currency_symbol = st.session_state.get('currency', '$')
+    cost_per_alert = ss.get('cost_per_alert', 0)
+    cost_per_incident = ss.get('cost_per_incident', 0)
+    alert_volume = ss.get('alert_volume', 0)
+    incident_volume = ss.get('incident_volume', 0)
+    alert_ftes = ss.get('alert_ftes', 0)
+    incident_ftes = ss.get('incident_ftes', 0)
+    alert_fte_time_pct = ss.get('alert_fte_time_pct', 100)
+    incident_fte_time_pct = ss.get('incident_fte_time_pct', 100)
+    avg_alert_triage_time = ss.get('avg_alert_triage_time', 0)
+    avg_incident_triage_time = ss.get('avg_incident_triage_time', 0)
+    avg_alert_fte_salary = ss.get('avg_alert_fte_salary', 0)
+    avg_incident_fte_salary = ss.get('avg_incident_fte_salary', 0)
+    working_hours_per_fte_per_year = ss.get('working_hours_per_fte_per_year', 2000)
+    alert_fte_percentage = ss.get('alert_fte_percentage', 0)
+    incident_fte_percentage = ss.get('incident_fte_percentage', 0)
+    currency_symbol = ss.get('currency', '$')
     
     col1, col2 = st.columns(2)
     
@@ -463,61 +505,58 @@ def show_detailed_calculation_breakdown():
         else:
             st.info("No incident data provided")
 
+# Score deducted per red flag of each severity; warnings cost 5 points each
+RED_FLAG_SCORE_PENALTIES = {'critical': 30, 'high': 20, 'medium': 10}
+
+# Data quality tiers, highest first: (minimum score, Streamlit element, icon, rating, summary)
+DATA_QUALITY_TIERS = (
+    (90, st.success, "🟢", "Excellent", "Your inputs appear consistent and realistic."),
+    (70, st.warning, "🟡", "Good", "Your inputs are mostly reasonable with some items to review."),
+    (50, st.error, "🟠", "Needs Review", "Several calculation issues detected. Please review your inputs."),
+    (0, st.error, "🔴", "Poor", "Major calculation issues detected. Data likely needs significant correction."),
+)
+
 def show_data_quality_score(red_flags, warnings):
     """Calculate and display a data quality score"""
     st.markdown("### Data Quality Assessment")
     
     # Calculate quality score
-    score = 100
-    score -= len([f for f in red_flags if f['severity'] == 'critical']) * 30
-    score -= len([f for f in red_flags if f['severity'] == 'high']) * 20
-    score -= len([f for f in red_flags if f['severity'] == 'medium']) * 10
-    score -= len(warnings) * 5
+    score = 100 - sum(RED_FLAG_SCORE_PENALTIES.get(f['severity'], 0) for f in red_flags) - len(warnings) * 5
     score = max(0, score)
     
-    # Display score with color coding
-    if score >= 90:
-        st.success(f"🟢 **Data Quality Score: {score}/100** - Excellent")
-        st.markdown("Your inputs appear consistent and realistic.")
-    elif score >= 70:
-        st.warning(f"🟡 **Data Quality Score: {score}/100** - Good")
-        st.markdown("Your inputs are mostly reasonable with some items to review.")
-    elif score >= 50:
-        st.error(f"🟠 **Data Quality Score: {score}/100** - Needs Review")
-        st.markdown("Several calculation issues detected. Please review your inputs.")
-    else:
-        st.error(f"🔴 **Data Quality Score: {score}/100** - Poor")
-        st.markdown("Major calculation issues detected. Data likely needs significant correction.")
+    # Display score with color coding, using the first tier the score reaches
+    show_score, icon, rating, summary = next(tier[1:] for tier in DATA_QUALITY_TIERS if score >= tier[0])
+    show_score(f"{icon} **Data Quality Score: {score}/100** - {rating}")
+    st.markdown(summary)
     
     # Show recommendations
     if score < 90:
         st.markdown("#### 🎯 Recommendations to Improve Data Quality:")
-        recommendations = []
-        
-        if any(f['type'] in ['Over-allocated Alert FTEs', 'Over-allocated Incident FTEs'] for f in red_flags):
-            recommendations.append("• **Fix FTE over-allocation**: Increase FTE count or the '% of FTE Time' dedicated to the task")
-        
-        if any(f['type'] in ['High Cost Per Alert', 'High Cost Per Incident'] for f in red_flags):
-            recommendations.append("• **Review cost calculations**: Check if '% of FTE Time', FTE counts, or salaries are realistic for the given volume")
-        
-        if any(f['type'] == 'Disproportionately High Benefits' for f in red_flags):
-            recommendations.append("• **Validate benefit assumptions**: Ensure improvement percentages and additional benefits are conservative")
-        
-        if any(w['type'] in ['Very Low Alert FTE Utilization', 'Very Low Incident FTE Utilization'] for w in warnings):
-            recommendations.append("• **Check FTE time allocation**: The workload is much lower than the time allocated; review the '% of FTE Time' input")
+        flagged_types = {f['type'] for f in red_flags}
+        warning_types = {w['type'] for w in warnings}
+        recommendations = (
+            "• **Fix FTE over-allocation**: Increase FTE count or the '% of FTE Time' dedicated to the task"
+            if flagged_types & {'Over-allocated Alert FTEs', 'Over-allocated Incident FTEs'} else "",
+            "• **Review cost calculations**: Check if '% of FTE Time', FTE counts, or salaries are realistic for the given volume"
+            if flagged_types & {'High Cost Per Alert', 'High Cost Per Incident'} else "",
+            "• **Validate benefit assumptions**: Ensure improvement percentages and additional benefits are conservative"
+            if 'Disproportionately High Benefits' in flagged_types else "",
+            "• **Check FTE time allocation**: The workload is much lower than the time allocated; review the '% of FTE Time' input"
+            if warning_types & {'Very Low Alert FTE Utilization', 'Very Low Incident FTE Utilization'} else "",
+        )
         
-        for rec in recommendations:
-            st.markdown(rec)
+        recommendations_text = "\n\n".join(rec for rec in recommendations if rec)
+        if recommendations_text:
+            st.markdown(recommendations_text)
 
 def show_enhanced_validation_section():
     """Enhanced validation section with detailed reasoning"""
     st.markdown("---")
     
-    # Show the calculation reasoning dashboard
-    show_calculation_reasoning_dashboard()
+    # Show the calculation reasoning dashboard, reusing its red flags for the quick fixes
+    red_flags, warnings = show_calculation_reasoning_dashboard()
     
     # Add quick fix suggestions
-    red_flags, warnings = detect_calculation_red_flags()
     if red_flags or warnings:
         with st.expander("🔧 Quick Fix Suggestions"):
             if any(f['type'] in ['Over-allocated Alert FTEs', 'Over-allocated Incident FTEs'] for f in red_flags):
@@ -548,87 +587,92 @@ def show_enhanced_validation_section():
 
 def run_monte_carlo_simulation(n_simulations=1000):
     """Run Monte Carlo simulation for ROI uncertainty analysis"""
+    ss = st.session_state
     # Get current values from session state
-    alert_reduction_pct = st.session_state.get('alert_reduction_pct', 0)
-    incident_reduction_pct = st.session_state.get('incident_reduction_pct', 0)
-    mttr_improvement_pct = st.session_state.get('mttr_improvement_pct', 0)
-    implementation_delay_months = st.session_state.get('implementation_delay', 6)
-    platform_cost = st.session_state.get('platform_cost', 0)
-    services_cost = st.session_state.get('services_cost', 0)
-    evaluation_years = st.session_state.get('evaluation_years', 3)
-    discount_rate = st.session_state.get('discount_rate', 10) / 100
+    alert_reduction_pct = ss.get('alert_reduction_pct', 0)
+    incident_reduction_pct = ss.get('incident_reduction_pct', 0)
+    mttr_improvement_pct = ss.get('mttr_improvement_pct', 0)
+    implementation_delay_months = ss.get('implementation_delay', 6)
+    platform_cost = ss.get('platform_cost', 0)
+    services_cost = ss.get('services_cost', 0)
+    evaluation_years = ss.get('evaluation_years', 3)
+    discount_rate = ss.get('discount_rate', 10) / 100
     
     # Get other required values
-    alert_volume = st.session_state.get('alert_volume', 0)
-    incident_volume = st.session_state.get('incident_volume', 0)
-    major_incident_volume = st.session_state.get('major_incident_volume', 0)
-    cost_per_alert = st.session_state.get('cost_per_alert', 0)
-    cost_per_incident = st.session_state.get('cost_per_incident', 0)
-    avg_mttr_hours = st.session_state.get('avg_mttr_hours', 0)
-    avg_major_incident_cost = st.session_state.get('avg_major_incident_cost', 0)
-    tool_savings = st.session_state.get('tool_savings', 0)
-    people_cost_per_year = st.session_state.get('people_efficiency', 0)
-    fte_avoidance = st.session_state.get('fte_avoidance', 0)
-    sla_penalty_avoidance = st.session_state.get('sla_penalty', 0)
-    revenue_growth = st.session_state.get('revenue_growth', 0)
-    capex_savings = st.session_state.get('capex_savings', 0)
-    opex_savings = st.session_state.get('opex_savings', 0)
-    benefits_ramp_up_months = st.session_state.get('benefits_ramp_up', 3)
+    alert_volume = ss.get('alert_volume', 0)
+    incident_volume = ss.get('incident_volume', 0)
+    major_incident_volume = ss.get('major_incident_volume', 0)
+    cost_per_alert = ss.get('cost_per_alert', 0)
+    cost_per_incident = ss.get('cost_per_incident', 0)
+    avg_mttr_hours = ss.get('avg_mttr_hours', 0)
+    avg_major_incident_cost = ss.get('avg_major_incident_cost', 0)
+    tool_savings = ss.get('tool_savings', 0)
+    people_cost_per_year = ss.get('people_efficiency', 0)
+    fte_avoidance = ss.get('fte_avoidance', 0)
+    sla_penalty_avoidance = ss.get('sla_penalty', 0)
+    revenue_growth = ss.get('revenue_growth', 0)
+    capex_savings = ss.get('capex_savings', 0)
+    opex_savings = ss.get('opex_savings', 0)
+    benefits_ramp_up_months = ss.get('benefits_ramp_up', 3)
     
     np.random.seed(42)  # For reproducible results
-    roi_results = []
-    npv_results = []
-    
-    for _ in range(n_simulations):
-        # Add random variation to key inputs (assuming normal distribution with std dev = 20% of mean)
-        sim_alert_reduction = max(0, min(100, np.random.normal(alert_reduction_pct, alert_reduction_pct * 0.2)))
-        sim_incident_reduction = max(0, min(100, np.random.normal(incident_reduction_pct, incident_reduction_pct * 0.2)))
-        sim_mttr_improvement = max(0, min(100, np.random.normal(mttr_improvement_pct, mttr_improvement_pct * 0.2)))
-        sim_implementation_delay = max(1, np.random.normal(implementation_delay_months, implementation_delay_months * 0.15))
-        sim_platform_cost = max(0, np.random.normal(platform_cost, platform_cost * 0.1))
-        sim_services_cost = max(0, np.random.normal(services_cost, services_cost * 0.15))
-        
-        # Calculate benefits with simulated values
-        sim_alert_savings = (alert_volume * sim_alert_reduction / 100) * cost_per_alert
-        sim_incident_savings = (incident_volume * sim_incident_reduction / 100) * cost_per_incident
-        sim_mttr_savings = major_incident_volume * (sim_mttr_improvement / 100) * avg_mttr_hours * avg_major_incident_cost
-        
-        sim_total_benefits = (sim_alert_savings + sim_incident_savings + sim_mttr_savings + 
-                             tool_savings + people_cost_per_year + fte_avoidance + 
-                             sla_penalty_avoidance + revenue_growth + capex_savings + opex_savings)
-        
-        # Calculate NPV with simulated values (simplified)
-        sim_cash_flows = []
-        for year in range(1, evaluation_years + 1):
-            year_benefits = sim_total_benefits
-            year_platform_cost = sim_platform_cost
-            year_services_cost = sim_services_cost if year == 1 else 0
-            year_net_cash_flow = year_benefits - year_platform_cost - year_services_cost
-            sim_cash_flows.append(year_net_cash_flow)
-        
-        sim_npv = sum([cf / ((1 + discount_rate) ** (i+1)) for i, cf in enumerate(sim_cash_flows)])
-        sim_total_costs = sim_platform_cost * evaluation_years + sim_services_cost
-        sim_roi = (sim_npv / sim_total_costs * 100) if sim_total_costs > 0 else 0
-        
-        roi_results.append(sim_roi)
-        npv_results.append(sim_npv)
+    
+    # Draw all random variations up front, one row per simulation (assuming normal distribution
+    # with std dev = 20% of mean). Columns follow the original per-simulation draw order:
+    # alert reduction, incident reduction, MTTR, implementation delay, platform cost, services cost
+    draws = np.random.standard_normal((n_simulations, 6))
+    sim_alert_reduction = np.clip(alert_reduction_pct + alert_reduction_pct * 0.2 * draws[:, 0], 0, 100)
+    sim_incident_reduction = np.clip(incident_reduction_pct + incident_reduction_pct * 0.2 * draws[:, 1], 0, 100)
+    sim_mttr_improvement = np.clip(mttr_improvement_pct + mttr_improvement_pct * 0.2 * draws[:, 2], 0, 100)
+    sim_platform_cost = np.maximum(0, platform_cost + platform_cost * 0.1 * draws[:, 4])
+    sim_services_cost = np.maximum(0, services_cost + services_cost * 0.15 * draws[:, 5])
+    
+    # Calculate benefits with simulated values
+    sim_alert_savings = (alert_volume * sim_alert_reduction / 100) * cost_per_alert
+    sim_incident_savings = (incident_volume * sim_incident_reduction / 100) * cost_per_incident
+    sim_mttr_savings = major_incident_volume * (sim_mttr_improvement / 100) * avg_mttr_hours * avg_major_incident_cost
+    fixed_benefits = (tool_savings + people_cost_per_year + fte_avoidance + 
+                      sla_penalty_avoidance + revenue_growth + capex_savings + opex_savings)
+    
+    if NUMEXPR_AVAILABLE:
+        sim_total_benefits = ne.evaluate(
+            "sim_alert_savings + sim_incident_savings + sim_mttr_savings + fixed_benefits",
+            local_dict={
+                'sim_alert_savings': sim_alert_savings,
+                'sim_incident_savings': sim_incident_savings,
+                'sim_mttr_savings': sim_mttr_savings,
+                'fixed_benefits': fixed_benefits
+            }
+        )
+    else:
+        sim_total_benefits = sim_alert_savings + sim_incident_savings + sim_mttr_savings + fixed_benefits
+    
+    # Calculate NPV with simulated values (simplified) - services cost is only incurred in year 1
+    years = np.arange(1, evaluation_years + 1)
+    sim_cash_flows = (sim_total_benefits - sim_platform_cost)[:, np.newaxis] - np.outer(sim_services_cost, years == 1)
+    npv_results = sim_cash_flows @ calculate_discount_factors(evaluation_years, discount_rate)
+    
+    sim_total_costs = sim_platform_cost * evaluation_years + sim_services_cost
+    roi_results = np.divide(npv_results, sim_total_costs,
+                            out=np.zeros_like(npv_results), where=sim_total_costs > 0) * 100
     
     return roi_results, npv_results
 
 def calculate_break_even_scenarios():
     """Calculate various break-even scenarios"""
+    ss = st.session_state
     break_even_scenarios = {}
     
-    platform_cost = st.session_state.get('platform_cost', 0)
-    services_cost = st.session_state.get('services_cost', 0)
-    evaluation_years = st.session_state.get('evaluation_years', 3)
-    alert_volume = st.session_state.get('alert_volume', 0)
-    incident_volume = st.session_state.get('incident_volume', 0)
-    major_incident_volume = st.session_state.get('major_incident_volume', 0)
-    cost_per_alert = st.session_state.get('cost_per_alert', 0)
-    cost_per_incident = st.session_state.get('cost_per_incident', 0)
-    avg_mttr_hours = st.session_state.get('avg_mttr_hours', 0)
-    avg_major_incident_cost = st.session_state.get('avg_major_incident_cost', 0)
+    platform_cost = ss.get('platform_cost', 0)
+    services_cost = ss.get('services_cost', 0)
+    evaluation_years = ss.get('evaluation_years', 3)
+    alert_volume = ss.get('alert_volume', 0)
+    incident_volume = ss.get('incident_volume', 0)
+    major_incident_volume = ss.get('major_incident_volume', 0)
+    cost_per_alert = ss.get('cost_per_alert', 0)
+    cost_per_incident = ss.get('cost_per_incident', 0)
+    avg_mttr_hours = ss.get('avg_mttr_hours', 0)
+    avg_major_incident_cost = ss.get('avg_major_incident_cost', 0)
     
     total_costs_annual = platform_cost + (services_cost / evaluation_years)
     
@@ -651,31 +695,38 @@ def calculate_break_even_scenarios():
 
 # --- ENHANCED VISUALIZATION FUNCTIONS ---
 
+def format_currency_values(values, currency_symbol):
+    """Format a sequence of amounts as whole-number currency strings for display tables"""
+    return list(map(f"{currency_symbol}{{:,.0f}}".format, values))
+
 def create_before_after_comparison():
     """Show before/after operational metrics"""
+    ss = st.session_state
     # Get values from session state
-    alert_volume = st.session_state.get('alert_volume', 0)
-    incident_volume = st.session_state.get('incident_volume', 0)
-    major_incident_volume = st.session_state.get('major_incident_volume', 0)
-    avg_mttr_hours = st.session_state.get('avg_mttr_hours', 0)
-    mttr_improvement_pct = st.session_state.get('mttr_improvement_pct', 0)
-    currency_symbol = st.session_state.get('currency', '$')
+    alert_volume = ss.get('alert_volume', 0)
+    incident_volume = ss.get('incident_volume', 0)
+    major_incident_volume = ss.get('major_incident_volume', 0)
+    avg_mttr_hours = ss.get('avg_mttr_hours', 0)
+    mttr_improvement_pct = ss.get('mttr_improvement_pct', 0)
+    currency_symbol = ss.get('currency', '$')
     
     # Get calculated savings from session state
-    alert_reduction_savings = st.session_state.get('alert_reduction_savings', 0)
-    alert_triage_savings = st.session_state.get('alert_triage_savings', 0)
-    incident_reduction_savings = st.session_state.get('incident_reduction_savings', 0)
-    incident_triage_savings = st.session_state.get('incident_triage_savings', 0)
-    major_incident_savings = st.session_state.get('major_incident_savings', 0)
+    alert_reduction_savings = ss.get('alert_reduction_savings', 0)
+    alert_triage_savings = ss.get('alert_triage_savings', 0)
+    incident_reduction_savings = ss.get('incident_reduction_savings', 0)
+    incident_triage_savings = ss.get('incident_triage_savings', 0)
+    major_incident_savings = ss.get('major_incident_savings', 0)
     
     # Calculate remaining values
-    remaining_alerts = alert_volume * (1 - st.session_state.get('alert_reduction_pct', 0) / 100)
-    remaining_incidents = incident_volume * (1 - st.session_state.get('incident_reduction_pct', 0) / 100)
+    remaining_alerts = alert_volume * (1 - ss.get('alert_reduction_pct', 0) / 100)
+    remaining_incidents = incident_volume * (1 - ss.get('incident_reduction_pct', 0) / 100)
     
     # Calculate total savings for each category
     total_alert_savings = alert_reduction_savings + alert_triage_savings
     total_incident_savings = incident_reduction_savings + incident_triage_savings
     
+    major_incident_savings_display = f"{currency_symbol}{major_incident_savings:,.0f}"
+    
     comparison_data = {
         'Metric': [
             'Alerts/Year',
@@ -698,8 +749,8 @@ def create_before_after_comparison():
         'Annual Savings': [
             f"{currency_symbol}{total_alert_savings:,.0f}",
             f"{currency_symbol}{total_incident_savings:,.0f}",
-            f"{currency_symbol}{major_incident_savings:,.0f}",
-            f"{currency_symbol}{major_incident_savings:,.0f}",  # MTTR savings shown here too
+            major_incident_savings_display,
+            major_incident_savings_display,  # MTTR savings shown here too
         ]
     }
     
@@ -707,22 +758,23 @@ def create_before_after_comparison():
 
 def create_benefit_breakdown_chart(currency_symbol):
     """Create a detailed breakdown of benefits by category"""
+    ss = st.session_state
     
     # Get benefit values from session state
-    alert_reduction_savings = st.session_state.get('alert_reduction_savings', 0)
-    alert_triage_savings = st.session_state.get('alert_triage_savings', 0)
-    incident_reduction_savings = st.session_state.get('incident_reduction_savings', 0)
-    incident_triage_savings = st.session_state.get('incident_triage_savings', 0)
-    major_incident_savings = st.session_state.get('major_incident_savings', 0)
-    tool_savings = st.session_state.get('tool_savings', 0)
-    people_cost_per_year = st.session_state.get('people_efficiency', 0)
-    fte_avoidance = st.session_state.get('fte_avoidance', 0)
-    sla_penalty_avoidance = st.session_state.get('sla_penalty', 0)
-    revenue_growth = st.session_state.get('revenue_growth', 0)
-    capex_savings = st.session_state.get('capex_savings', 0)
-    opex_savings = st.session_state.get('opex_savings', 0)
+    alert_reduction_savings = ss.get('alert_reduction_savings', 0)
+    alert_triage_savings = ss.get('alert_triage_savings', 0)
+    incident_reduction_savings = ss.get('incident_reduction_savings', 0)
+    incident_triage_savings = ss.get('incident_triage_savings', 0)
+    major_incident_savings = ss.get('major_incident_savings', 0)
+    tool_savings = ss.get('tool_savings', 0)
+    people_cost_per_year = ss.get('people_efficiency', 0)
+    fte_avoidance = ss.get('fte_avoidance', 0)
+    sla_penalty_avoidance = ss.get('sla_penalty', 0)
+    revenue_growth = ss.get('revenue_growth', 0)
+    capex_savings = ss.get('capex_savings', 0)
+    opex_savings = ss.get('opex_savings', 0)
     # Asset management benefits (no CMDB)
-    asset_discovery_savings = st.session_state.get('asset_discovery_savings', 0)
+    asset_discovery_savings = ss.get('asset_discovery_savings', 0)
     
     benefits_data = {
         'Category': [
@@ -764,30 +816,31 @@ def create_benefit_breakdown_chart(currency_symbol):
 
 def create_cost_vs_benefit_waterfall(currency_symbol):
     """Create a waterfall chart showing cost vs benefits"""
+    ss = st.session_state
     
     # Get values from session state
-    alert_reduction_savings = st.session_state.get('alert_reduction_savings', 0)
-    alert_triage_savings = st.session_state.get('alert_triage_savings', 0)
-    incident_reduction_savings = st.session_state.get('incident_reduction_savings', 0)
-    incident_triage_savings = st.session_state.get('incident_triage_savings', 0)
-    major_incident_savings = st.session_state.get('major_incident_savings', 0)
-    tool_savings = st.session_state.get('tool_savings', 0)
-    people_cost_per_year = st.session_state.get('people_efficiency', 0)
-    fte_avoidance = st.session_state.get('fte_avoidance', 0)
-    sla_penalty_avoidance = st.session_state.get('sla_penalty', 0)
-    revenue_growth = st.session_state.get('revenue_growth', 0)
-    capex_savings = st.session_state.get('capex_savings', 0)
-    opex_savings = st.session_state.get('opex_savings', 0)
-    platform_cost = st.session_state.get('platform_cost', 0)
-    services_cost = st.session_state.get('services_cost', 0)
+    alert_reduction_savings = ss.get('alert_reduction_savings', 0)
+    alert_triage_savings = ss.get('alert_triage_savings', 0)
+    incident_reduction_savings = ss.get('incident_reduction_savings', 0)
+    incident_triage_savings = ss.get('incident_triage_savings', 0)
+    major_incident_savings = ss.get('major_incident_savings', 0)
+    tool_savings = ss.get('tool_savings', 0)
+    people_cost_per_year = ss.get('people_efficiency', 0)
+    fte_avoidance = ss.get('fte_avoidance', 0)
+    sla_penalty_avoidance = ss.get('sla_penalty', 0)
+    revenue_growth = ss.get('revenue_growth', 0)
+    capex_savings = ss.get('capex_savings', 0)
+    opex_savings = ss.get('opex_savings', 0)
+    platform_cost = ss.get('platform_cost', 0)
+    services_cost = ss.get('services_cost', 0)
     # Asset management savings (no CMDB)
-    asset_discovery_savings = st.session_state.get('asset_discovery_savings', 0)
+    asset_discovery_savings = ss.get('asset_discovery_savings', 0)
     
     # Prepare data for waterfall chart
     categories = ['Starting Point', 'Alert Savings', 'Incident Savings', 'MTTR Savings', 
                  'Asset Management Savings', 'Additional Benefits', 'Platform Cost', 'Services Cost', 'Net Position']
     
-    values = [0, 
+    values = np.array([0, 
              alert_reduction_savings + alert_triage_savings,
              incident_reduction_savings + incident_triage_savings,
              major_incident_savings,
@@ -795,10 +848,10 @@ def create_cost_vs_benefit_waterfall(currency_symbol):
              tool_savings + people_cost_per_year + fte_avoidance + sla_penalty_avoidance + revenue_growth + capex_savings + opex_savings,
              -platform_cost,
              -services_cost,
-             0]  # Will be calculated
+             0], dtype=float)  # Will be calculated
     
     # Calculate cumulative for net position
-    values[-1] = sum(values[1:-1])
+    values[-1] = values[1:-1].sum()
     
     fig = go.Figure(go.Waterfall(
         name="Annual Impact",
@@ -807,7 +860,7 @@ def create_cost_vs_benefit_waterfall(currency_symbol):
         x=categories,
         y=values,
         connector={"line": {"color": "rgb(63, 63, 63)"}},
-        text=[f"{currency_symbol}{v:,.0f}" for v in values],
+        text=format_currency_values(values, currency_symbol),
         textposition="outside"
     ))
     
@@ -824,7 +877,7 @@ def create_roi_comparison_chart(scenario_results, currency_symbol):
     """Create ROI comparison across scenarios with confidence intervals"""
     
     scenarios_list = list(scenario_results.keys())
-    rois = [scenario_results[scenario]['roi'] * 100 for scenario in scenarios_list]
+    rois = np.array([scenario_results[scenario]['roi'] for scenario in scenarios_list]) * 100
     npvs = [scenario_results[scenario]['npv'] for scenario in scenarios_list]
     colors_list = [scenario_results[scenario]['color'] for scenario in scenarios_list]
     
@@ -837,7 +890,7 @@ def create_roi_comparison_chart(scenario_results, currency_symbol):
         x=scenarios_list,
         y=rois,
         marker_color=colors_list,
-        text=[f'{roi:.1f}%' for roi in rois],
+        text=list(map('{:.1f}%'.format, rois)),
         textposition='outside',
         yaxis='y'
     ))
@@ -863,205 +916,233 @@ def create_roi_comparison_chart(scenario_results, currency_symbol):
     
     return fig
 
+def create_scenario_summary(scenario_results):
+    """Collect the headline metrics of every scenario into one table, one row per scenario"""
+    return pd.DataFrame([
+        {
+            'name': name,
+            'npv': result['npv'],
+            'roi': result['roi'],
+            'payback': result['payback'],
+            'payback_months': result['payback_months']
+        }
+        for name, result in scenario_results.items()
+    ]).set_index('name')
+
+@st.cache_data(show_spinner=False)
+def create_npv_calculation_table(cash_flows, discount_factors, present_values, discount_rate, currency_symbol):
+    """Build the formatted year-by-year NPV calculation table, formatting each column in one pass"""
+    discount_label = f"1/(1.{int(discount_rate*100):02d})"
+    return pd.DataFrame({
+        'Year': cash_flows['year'],
+        'Benefits': format_currency_values(cash_flows['benefits'], currency_symbol),
+        'Platform Cost': format_currency_values(cash_flows['platform_cost'], currency_symbol),
+        'Services Cost': format_currency_values(cash_flows['services_cost'], currency_symbol),
+        'Net Cash Flow': format_currency_values(cash_flows['net_cash_flow'], currency_symbol),
+        'Discount Factor': list(map(f"{discount_label}^{{}} = {{:.3f}}".format, cash_flows['year'], discount_factors)),
+        'Present Value': format_currency_values(present_values, currency_symbol),
+        'Cumulative NPV': format_currency_values(np.cumsum(present_values), currency_symbol)
+    })
+
 # --- EXPORT/IMPORT FUNCTIONS ---
 
+# All exportable input keys, in export order (removed compliance fields)
+INPUT_KEYS = (
+    # Basic Configuration
+    'solution_name', 'industry_template', 'currency', 
+
+    # Implementation Timeline
+    'implementation_delay', 'benefits_ramp_up', 'billing_start_month',
+
+    # Working Hours Configuration
+    'hours_per_day', 'days_per_week', 'weeks_per_year', 'holiday_sick_days',
+
+    # Alert Management
+    'alert_volume', 'alert_ftes', 'alert_fte_time_pct', 'avg_alert_triage_time', 'avg_alert_fte_salary',
+    'alert_reduction_pct', 'alert_triage_time_saved_pct',
+
+    # Incident Management
+    'incident_volume', 'incident_ftes', 'incident_fte_time_pct', 'avg_incident_triage_time', 'avg_incident_fte_salary',
+    'incident_reduction_pct', 'incident_triage_time_savings_pct',
+
+    # Major Incidents
+    'major_incident_volume', 'avg_major_incident_cost', 'avg_mttr_hours', 'mttr_improvement_pct',
+
+    # Asset Discovery (no CMDB)
+    'asset_volume', 'manual_discovery_cycles_per_year', 'hours_per_discovery_cycle',
+    'asset_management_ftes', 'asset_mgmt_fte_time_pct', 'avg_asset_mgmt_fte_salary', 'asset_discovery_automation_pct',
+
+    # Additional Benefits
+    'tool_savings', 'people_efficiency', 'fte_avoidance', 'sla_penalty', 
+    'revenue_growth', 'capex_savings', 'opex_savings',
+
+    # Costs
+    'platform_cost', 'services_cost',
+
+    # Financial Settings
+    'evaluation_years', 'discount_rate'
+)
+
 def get_all_input_values():
     """Collect all input values from the current session state"""
-    input_values = {}
-    
-    # Get all the input keys from your existing inputs (removed compliance fields)
-    input_keys = [
-        # Basic Configuration
-        'solution_name', 'industry_template', 'currency', 
-        
-        # Implementation Timeline
-        'implementation_delay', 'benefits_ramp_up', 'billing_start_month',
-        
-        # Working Hours Configuration
-        'hours_per_day', 'days_per_week', 'weeks_per_year', 'holiday_sick_days',
-        
-        # Alert Management
-        'alert_volume', 'alert_ftes', 'alert_fte_time_pct', 'avg_alert_triage_time', 'avg_alert_fte_salary',
-        'alert_reduction_pct', 'alert_triage_time_saved_pct',
-        
-        # Incident Management
-        'incident_volume', 'incident_ftes', 'incident_fte_time_pct', 'avg_incident_triage_time', 'avg_incident_fte_salary',
-        'incident_reduction_pct', 'incident_triage_time_savings_pct',
-        
-        # Major Incidents
-        'major_incident_volume', 'avg_major_incident_cost', 'avg_mttr_hours', 'mttr_improvement_pct',
-        
-        # Asset Discovery (no CMDB)
-        'asset_volume', 'manual_discovery_cycles_per_year', 'hours_per_discovery_cycle',
-        'asset_management_ftes', 'asset_mgmt_fte_time_pct', 'avg_asset_mgmt_fte_salary', 'asset_discovery_automation_pct',
-        
-        # Additional Benefits
-        'tool_savings', 'people_efficiency', 'fte_avoidance', 'sla_penalty', 
-        'revenue_growth', 'capex_savings', 'opex_savings',
-        
-        # Costs
-        'platform_cost', 'services_cost',
-        
-        # Financial Settings
-        'evaluation_years', 'discount_rate'
-    ]
-    
-    # Collect values from session state
-    for key in input_keys:
-        if key in st.session_state:
-            input_values[key] = st.session_state[key]
-        else:
-            # Fallback to default values if not in session state
-            input_values[key] = get_default_value(key)
-    
-    return input_values
+    # Take one snapshot of session state instead of probing it key by key
+    session_values = st.session_state.to_dict()
+    return {
+        key: session_values[key] if key in session_values else get_default_value(key)
+        for key in INPUT_KEYS
+    }
+
+# Default value for every exportable input
+INPUT_DEFAULTS = {
+    'solution_name': 'AIOPs',
+    'industry_template': 'Custom',
+    'currency': '$',
+    'implementation_delay': 6,
+    'benefits_ramp_up': 3,
+    'billing_start_month': 1,
+    'hours_per_day': 8.0,
+    'days_per_week': 5,
+    'weeks_per_year': 52,
+    'holiday_sick_days': 25,
+    'alert_volume': 0,
+    'alert_ftes': 0,
+    'alert_fte_time_pct': 100,
+    'avg_alert_triage_time': 0,
+    'avg_alert_fte_salary': 0,
+    'alert_reduction_pct': 0,
+    'alert_triage_time_saved_pct': 0,
+    'incident_volume': 0,
+    'incident_ftes': 0,
+    'incident_fte_time_pct': 100,
+    'avg_incident_triage_time': 0,
+    'avg_incident_fte_salary': 0,
+    'incident_reduction_pct': 0,
+    'incident_triage_time_savings_pct': 0,
+    'major_incident_volume': 0,
+    'avg_major_incident_cost': 0,
+    'avg_mttr_hours': 0.0,
+    'mttr_improvement_pct': 0,
+    # Asset management defaults (no CMDB)
+    'asset_volume': 0,
+    'manual_discovery_cycles_per_year': 0,
+    'hours_per_discovery_cycle': 0,
+    'asset_management_ftes': 0,
+    'asset_mgmt_fte_time_pct': 100,
+    'avg_asset_mgmt_fte_salary': 0,
+    'asset_discovery_automation_pct': 0,
+    'tool_savings': 0,
+    'people_efficiency': 0,
+    'fte_avoidance': 0,
+    'sla_penalty': 0,
+    'revenue_growth': 0,
+    'capex_savings': 0,
+    'opex_savings': 0,
+    'platform_cost': 0,
+    'services_cost': 0,
+    'evaluation_years': 3,
+    'discount_rate': 10
+}
 
 def get_default_value(key):
     """Get default values for inputs"""
-    defaults = {
-        'solution_name': 'AIOPs',
-        'industry_template': 'Custom',
-        'currency': '$',
-        'implementation_delay': 6,
-        'benefits_ramp_up': 3,
-        'billing_start_month': 1,
-        'hours_per_day': 8.0,
-        'days_per_week': 5,
-        'weeks_per_year': 52,
-        'holiday_sick_days': 25,
-        'alert_volume': 0,
-        'alert_ftes': 0,
-        'alert_fte_time_pct': 100,
-        'avg_alert_triage_time': 0,
-        'avg_alert_fte_salary': 0,
-        'alert_reduction_pct': 0,
-        'alert_triage_time_saved_pct': 0,
-        'incident_volume': 0,
-        'incident_ftes': 0,
-        'incident_fte_time_pct': 100,
-        'avg_incident_triage_time': 0,
-        'avg_incident_fte_salary': 0,
-        'incident_reduction_pct': 0,
-        'incident_triage_time_savings_pct': 0,
-        'major_incident_volume': 0,
-        'avg_major_incident_cost': 0,
-        'avg_mttr_hours': 0.0,
-        'mttr_improvement_pct': 0,
-        # Asset management defaults (no CMDB)
-        'asset_volume': 0,
-        'manual_discovery_cycles_per_year': 0,
-        'hours_per_discovery_cycle': 0,
-        'asset_management_ftes': 0,
-        'asset_mgmt_fte_time_pct': 100,
-        'avg_asset_mgmt_fte_salary': 0,
-        'asset_discovery_automation_pct': 0,
-        'tool_savings': 0,
-        'people_efficiency': 0,
-        'fte_avoidance': 0,
-        'sla_penalty': 0,
-        'revenue_growth': 0,
-        'capex_savings': 0,
-        'opex_savings': 0,
-        'platform_cost': 0,
-        'services_cost': 0,
-        'evaluation_years': 3,
-        'discount_rate': 10
-    }
-    return defaults.get(key, 0)
+    return INPUT_DEFAULTS.get(key, 0)
+
+# Parameter descriptions for better readability in CSV exports (removed compliance descriptions)
+INPUT_DESCRIPTIONS = {
+    'solution_name': 'Customer Name',
+    'industry_template': 'Industry Template',
+    'currency': 'Currency Symbol',
+    'implementation_delay': 'Implementation Delay (months)',
+    'benefits_ramp_up': 'Benefits Ramp-up Period (months)',
+    'billing_start_month': 'Billing Start Month',
+    'hours_per_day': 'Working Hours per Day',
+    'days_per_week': 'Working Days per Week',
+    'weeks_per_year': 'Working Weeks per Year',
+    'holiday_sick_days': 'Holiday + Sick Days per Year',
+    'alert_volume': 'Total Infrastructure Related Alerts per Year',
+    'alert_ftes': 'Total FTEs Managing Infrastructure Alerts',
+    'alert_fte_time_pct': '% of FTE Time on Alerts',
+    'avg_alert_triage_time': 'Average Alert Triage Time (minutes)',
+    'avg_alert_fte_salary': 'Average Annual Salary per Alert Management FTE',
+    'alert_reduction_pct': '% Alert Reduction',
+    'alert_triage_time_saved_pct': '% Alert Triage Time Reduction',
+    'incident_volume': 'Total Infrastructure Related Incident Volumes per Year',
+    'incident_ftes': 'Total FTEs Managing Infrastructure Incidents',
+    'incident_fte_time_pct': '% of FTE Time on Incidents',
+    'avg_incident_triage_time': 'Average Incident Triage Time (minutes)',
+    'avg_incident_fte_salary': 'Average Annual Salary per Incident Management FTE',
+    'incident_reduction_pct': '% Incident Reduction',
+    'incident_triage_time_savings_pct': '% Incident Triage Time Reduction',
+    'major_incident_volume': 'Total Infrastructure Related Major Incidents per Year (Sev1)',
+    'avg_major_incident_cost': 'Average Major Incident Cost per Hour',
+    'avg_mttr_hours': 'Average MTTR (hours)',
+    'mttr_improvement_pct': 'MTTR Improvement Percentage',
+    # Asset management descriptions (no CMDB)
+    'asset_volume': 'Total IT Assets Under Management',
+    'manual_discovery_cycles_per_year': 'Manual Discovery Cycles per Year',
+    'hours_per_discovery_cycle': 'Hours per Manual Discovery Cycle',
+    'asset_management_ftes': 'Total FTEs Managing IT Assets',
+    'asset_mgmt_fte_time_pct': '% of FTE Time on Asset Discovery',
+    'avg_asset_mgmt_fte_salary': 'Average Annual Salary per Asset Management FTE',
+    'asset_discovery_automation_pct': '% Asset Discovery Process Automated',
+    'tool_savings': 'Tool Consolidation Savings',
+    'people_efficiency': 'People Efficiency Gains',
+    'fte_avoidance': 'FTE Avoidance (annualized value)',
+    'sla_penalty': 'SLA Penalty Avoidance',
+    'revenue_growth': 'Revenue Growth',
+    'capex_savings': 'Capital Expenditure Savings',
+    'opex_savings': 'Operational Expenditure Savings',
+    'platform_cost': 'Annual Subscription Cost',
+    'services_cost': 'Implementation & Services (One-Time)',
+    'evaluation_years': 'Evaluation Period (Years)',
+    'discount_rate': 'NPV Discount Rate (%)'
+}
 
+def create_export_table(input_values):
+    """Build the Parameter/Value/Description table shared by the tabular export formats"""
+    return pd.DataFrame({
+        'Parameter': list(input_values.keys()),
+        'Value': pd.Series(list(input_values.values()), dtype=object),
+        'Description': [INPUT_DESCRIPTIONS.get(key, key.replace('_', ' ').title()) for key in input_values]
+    })
+
+@st.cache_data(show_spinner=False, max_entries=4)
 def export_to_csv(input_values):
     """Export input values to CSV format"""
-    output = StringIO()
-    writer = csv.writer(output)
-    
-    # Write header
-    writer.writerow(['Parameter', 'Value', 'Description'])
-    
-    # Define parameter descriptions for better readability (removed compliance descriptions)
-    descriptions = {
-        'solution_name': 'Customer Name',
-        'industry_template': 'Industry Template',
-        'currency': 'Currency Symbol',
-        'implementation_delay': 'Implementation Delay (months)',
-        'benefits_ramp_up': 'Benefits Ramp-up Period (months)',
-        'billing_start_month': 'Billing Start Month',
-        'hours_per_day': 'Working Hours per Day',
-        'days_per_week': 'Working Days per Week',
-        'weeks_per_year': 'Working Weeks per Year',
-        'holiday_sick_days': 'Holiday + Sick Days per Year',
-        'alert_volume': 'Total Infrastructure Related Alerts per Year',
-        'alert_ftes': 'Total FTEs Managing Infrastructure Alerts',
-        'alert_fte_time_pct': '% of FTE Time on Alerts',
-        'avg_alert_triage_time': 'Average Alert Triage Time (minutes)',
-        'avg_alert_fte_salary': 'Average Annual Salary per Alert Management FTE',
-        'alert_reduction_pct': '% Alert Reduction',
-        'alert_triage_time_saved_pct': '% Alert Triage Time Reduction',
-        'incident_volume': 'Total Infrastructure Related Incident Volumes per Year',
-        'incident_ftes': 'Total FTEs Managing Infrastructure Incidents',
-        'incident_fte_time_pct': '% of FTE Time on Incidents',
-        'avg_incident_triage_time': 'Average Incident Triage Time (minutes)',
-        'avg_incident_fte_salary': 'Average Annual Salary per Incident Management FTE',
-        'incident_reduction_pct': '% Incident Reduction',
-        'incident_triage_time_savings_pct': '% Incident Triage Time Reduction',
-        'major_incident_volume': 'Total Infrastructure Related Major Incidents per Year (Sev1)',
-        'avg_major_incident_cost': 'Average Major Incident Cost per Hour',
-        'avg_mttr_hours': 'Average MTTR (hours)',
-        'mttr_improvement_pct': 'MTTR Improvement Percentage',
-        # Asset management descriptions (no CMDB)
-        'asset_volume': 'Total IT Assets Under Management',
-        'manual_discovery_cycles_per_year': 'Manual Discovery Cycles per Year',
-        'hours_per_discovery_cycle': 'Hours per Manual Discovery Cycle',
-        'asset_management_ftes': 'Total FTEs Managing IT Assets',
-        'asset_mgmt_fte_time_pct': '% of FTE Time on Asset Discovery',
-        'avg_asset_mgmt_fte_salary': 'Average Annual Salary per Asset Management FTE',
-        'asset_discovery_automation_pct': '% Asset Discovery Process Automated',
-        'tool_savings': 'Tool Consolidation Savings',
-        'people_efficiency': 'People Efficiency Gains',
-        'fte_avoidance': 'FTE Avoidance (annualized value)',
-        'sla_penalty': 'SLA Penalty Avoidance',
-        'revenue_growth': 'Revenue Growth',
-        'capex_savings': 'Capital Expenditure Savings',
-        'opex_savings': 'Operational Expenditure Savings',
-        'platform_cost': 'Annual Subscription Cost',
-        'services_cost': 'Implementation & Services (One-Time)',
-        'evaluation_years': 'Evaluation Period (Years)',
-        'discount_rate': 'NPV Discount Rate (%)'
-    }
-    
-    # Write data rows
-    for key, value in input_values.items():
-        description = descriptions.get(key, key.replace('_', ' ').title())
-        writer.writerow([key, value, description])
-    
-    return output.getvalue()
+    # Build all rows at once and let pandas write the CSV
+    return create_export_table(input_values).to_csv(index=False)
+
+def convert_imported_value(value):
+    """Convert one imported text value: decimals become floats, whole numbers ints, anything else stays a string"""
+    try:
+        return float(value) if '.' in value else int(value)
+    except (ValueError, TypeError):
+        return value
+
+def convert_imported_values(values):
+    """Convert a Series of imported text values: decimals become floats, whole numbers ints, anything else stays a string"""
+    numbers = pd.to_numeric(values, errors='coerce')
+    is_float = numbers.notna() & values.str.contains('.', regex=False)
+    # Plain ASCII whole numbers (with optional digit-group underscores); int() keeps arbitrarily large values exact
+    is_int = values.str.fullmatch(r'\s*[+-]?\d+(?:_\d+)*\s*')
+    converted = values.astype(object)
+    converted[is_float] = numbers[is_float].astype(object)
+    converted[is_int] = values[is_int].map(int)
+    # Anything the vectorized checks did not recognise (Unicode digits, underscored decimals, ...) goes through
+    # the per-value conversion, so every value imports exactly as float()/int() would parse it
+    is_other = ~(is_float | is_int)
+    converted[is_other] = values[is_other].map(convert_imported_value)
+    return converted.tolist()
 
 def import_from_csv(csv_content):
     """Import input values from CSV content and update session state"""
     try:
-        # Parse CSV content
-        reader = csv.DictReader(StringIO(csv_content))
-        imported_values = {}
-        
-        for row in reader:
-            key = row['Parameter']
-            value = row['Value']
-            
-            # Convert value to appropriate type
-            try:
-                # Try to convert to number first
-                if '.' in str(value):
-                    value = float(value)
-                else:
-                    value = int(value)
-            except (ValueError, TypeError):
-                # Keep as string if not a number
-                value = str(value)
-            
-            imported_values[key] = value
+        # Parse CSV content, keeping every value as text so types can be inferred below
+        import_df = pd.read_csv(StringIO(csv_content), dtype=str, keep_default_na=False)
+        imported_values = dict(zip(import_df['Parameter'], convert_imported_values(import_df['Value'])))
         
         # Update session state with imported values
-        for key, value in imported_values.items():
-            st.session_state[key] = value
+        st.session_state.update(imported_values)
         
         return True, f"Successfully imported {len(imported_values)} parameters"
     
@@ -1079,12 +1160,17 @@ def export_to_json(input_values):
         },
         'configuration': input_values
     }
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            export_data,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        ).decode('utf-8')
     return json.dumps(export_data, indent=2)
 
 def import_from_json(json_content):
-    """Import input values from JSON content and update session state"""
+    """Import input values from JSON content (str or UTF-8 bytes) and update session state"""
     try:
-        data = json.loads(json_content)
+        data = orjson.loads(json_content) if ORJSON_AVAILABLE else json.loads(json_content)
         
         # Extract configuration data
         if 'configuration' in data:
@@ -1094,71 +1180,96 @@ def import_from_json(json_content):
             imported_values = data
         
         # Update session state with imported values
-        for key, value in imported_values.items():
-            st.session_state[key] = value
+        st.session_state.update(imported_values)
         
         return True, f"Successfully imported {len(imported_values)} parameters"
     
     except Exception as e:
         return False, f"Error importing JSON: {str(e)}"
 
+@st.cache_data(show_spinner=False, max_entries=4)
+def export_to_parquet(input_values):
+    """Export input values to a zstd-compressed Parquet file"""
+    # Values are stored as text, like the CSV export, so the column has a single type
+    export_df = create_export_table(input_values)
+    export_df['Value'] = export_df['Value'].astype(str)
+    
+    output = BytesIO()
+    export_df.to_parquet(output, index=False, compression='zstd')
+    return output.getvalue()
+
+def import_from_parquet(parquet_content):
+    """Import input values from Parquet file bytes and update session state"""
+    try:
+        import_df = pd.read_parquet(BytesIO(parquet_content))
+        imported_values = dict(zip(import_df['Parameter'], convert_imported_values(import_df['Value'].astype(str))))
+        
+        # Update session state with imported values
+        st.session_state.update(imported_values)
+        
+        return True, f"Successfully imported {len(imported_values)} parameters"
+    
+    except Exception as e:
+        return False, f"Error importing Parquet: {str(e)}"
+
 # --- Enhanced PDF Executive Summary Functions ---
 
 def generate_executive_pdf_report(logo_file=None):
     """Generate a comprehensive PDF executive summary report"""
     if not REPORT_DEPENDENCIES_AVAILABLE:
-        return None, "PDF generation requires additional dependencies (reportlab, matplotlib)"
+        return None, "PDF generation requires additional dependencies (reportlab)"
     
     try:
         # Get current values from session state with proper defaults
-        solution_name = st.session_state.get('solution_name', 'AIOPs')
-        currency_symbol = st.session_state.get('currency', '$')
-        evaluation_years = st.session_state.get('evaluation_years', 3)
-        billing_start_month = st.session_state.get('billing_start_month', 1)
-        implementation_delay_months = st.session_state.get('implementation_delay', 6)
-        benefits_ramp_up_months = st.session_state.get('benefits_ramp_up', 3)
-        discount_rate = st.session_state.get('discount_rate', 10) / 100
+        ss = st.session_state
+        solution_name = ss.get('solution_name', 'AIOPs')
+        currency_symbol = ss.get('currency', '$')
+        evaluation_years = ss.get('evaluation_years', 3)
+        billing_start_month = ss.get('billing_start_month', 1)
+        implementation_delay_months = ss.get('implementation_delay', 6)
+        benefits_ramp_up_months = ss.get('benefits_ramp_up', 3)
+        discount_rate = ss.get('discount_rate', 10) / 100
         
         # Get input values with defaults
-        alert_volume = st.session_state.get('alert_volume', 0)
-        incident_volume = st.session_state.get('incident_volume', 0)
-        major_incident_volume = st.session_state.get('major_incident_volume', 0)
-        alert_reduction_pct = st.session_state.get('alert_reduction_pct', 0)
-        incident_reduction_pct = st.session_state.get('incident_reduction_pct', 0)
-        mttr_improvement_pct = st.session_state.get('mttr_improvement_pct', 0)
+        alert_volume = ss.get('alert_volume', 0)
+        incident_volume = ss.get('incident_volume', 0)
+        major_incident_volume = ss.get('major_incident_volume', 0)
+        alert_reduction_pct = ss.get('alert_reduction_pct', 0)
+        incident_reduction_pct = ss.get('incident_reduction_pct', 0)
+        mttr_improvement_pct = ss.get('mttr_improvement_pct', 0)
         
         # Calculate working hours
-        hours_per_day = st.session_state.get('hours_per_day', 8.0)
-        days_per_week = st.session_state.get('days_per_week', 5)
-        weeks_per_year = st.session_state.get('weeks_per_year', 52)
-        holiday_sick_days = st.session_state.get('holiday_sick_days', 25)
+        hours_per_day = ss.get('hours_per_day', 8.0)
+        days_per_week = ss.get('days_per_week', 5)
+        weeks_per_year = ss.get('weeks_per_year', 52)
+        holiday_sick_days = ss.get('holiday_sick_days', 25)
         working_hours_fte_year = ((weeks_per_year * days_per_week) - holiday_sick_days) * hours_per_day
         
         # Get costs
-        platform_cost = st.session_state.get('platform_cost', 0)
-        services_cost = st.session_state.get('services_cost', 0)
+        platform_cost = ss.get('platform_cost', 0)
+        services_cost = ss.get('services_cost', 0)
         
         # Get calculated benefits from session state
-        total_annual_benefits = st.session_state.get('total_annual_benefits', 0)
-        alert_reduction_savings = st.session_state.get('alert_reduction_savings', 0)
-        incident_reduction_savings = st.session_state.get('incident_reduction_savings', 0)
-        major_incident_savings = st.session_state.get('major_incident_savings', 0)
-        alert_triage_savings = st.session_state.get('alert_triage_savings', 0)
-        incident_triage_savings = st.session_state.get('incident_triage_savings', 0)
-        tool_savings = st.session_state.get('tool_savings', 0)
-        people_efficiency = st.session_state.get('people_efficiency', 0)
-        fte_avoidance = st.session_state.get('fte_avoidance', 0)
-        other_benefits = (st.session_state.get('sla_penalty', 0) + 
-                         st.session_state.get('revenue_growth', 0) + 
-                         st.session_state.get('capex_savings', 0) + 
-                         st.session_state.get('opex_savings', 0))
-        equivalent_ftes = st.session_state.get('equivalent_ftes_from_savings', 0)
-        operational_savings = st.session_state.get('total_operational_savings_from_time_saved', 0)
+        total_annual_benefits = ss.get('total_annual_benefits', 0)
+        alert_reduction_savings = ss.get('alert_reduction_savings', 0)
+        incident_reduction_savings = ss.get('incident_reduction_savings', 0)
+        major_incident_savings = ss.get('major_incident_savings', 0)
+        alert_triage_savings = ss.get('alert_triage_savings', 0)
+        incident_triage_savings = ss.get('incident_triage_savings', 0)
+        tool_savings = ss.get('tool_savings', 0)
+        people_efficiency = ss.get('people_efficiency', 0)
+        fte_avoidance = ss.get('fte_avoidance', 0)
+        other_benefits = (ss.get('sla_penalty', 0) + 
+                         ss.get('revenue_growth', 0) + 
+                         ss.get('capex_savings', 0) + 
+                         ss.get('opex_savings', 0))
+        equivalent_ftes = ss.get('equivalent_ftes_from_savings', 0)
+        operational_savings = ss.get('total_operational_savings_from_time_saved', 0)
         # Asset management benefits (no CMDB)
-        asset_discovery_savings = st.session_state.get('asset_discovery_savings', 0)
+        asset_discovery_savings = ss.get('asset_discovery_savings', 0)
         
         # Get scenario results from session state
-        scenario_results_from_state = st.session_state.get('scenario_results', None)
+        scenario_results_from_state = ss.get('scenario_results', None)
         if scenario_results_from_state:
             scenario_results = scenario_results_from_state
         else:
@@ -1172,227 +1283,279 @@ def generate_executive_pdf_report(logo_file=None):
                     'npv': basic_npv,
                     'roi': basic_roi,
                     'payback_months': '12 months',
-                    'description': 'Baseline assumptions as entered'
+                    'description': SCENARIO_DESCRIPTIONS['Expected']
                 },
                 'Conservative': {
                     'npv': basic_npv * 0.7,
                     'roi': basic_roi * 0.7,
                     'payback_months': '18 months',
-                    'description': 'Benefits 30% lower, implementation 30% longer'
+                    'description': SCENARIO_DESCRIPTIONS['Conservative']
                 },
                 'Optimistic': {
                     'npv': basic_npv * 1.2,
                     'roi': basic_roi * 1.2,
                     'payback_months': '9 months',
-                    'description': 'Benefits 20% higher, implementation 20% faster'
+                    'description': SCENARIO_DESCRIPTIONS['Optimistic']
                 }
             }
         
-        # Create PDF
-        buffer = BytesIO()
-        doc = SimpleDocTemplate(buffer, pagesize=letter, rightMargin=72, leftMargin=72, 
-                               topMargin=72, bottomMargin=18)
-        elements = []
-        styles = getSampleStyleSheet()
-        
-        # Define custom styles
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=24,
-            textColor=colors.darkblue,
-            spaceAfter=30,
-            alignment=TA_CENTER
-        )
-        
-        heading_style = ParagraphStyle(
-            'CustomHeading',
-            parent=styles['Heading2'],
-            fontSize=16,
-            textColor=colors.darkblue,
-            spaceBefore=20,
-            spaceAfter=12
-        )
-        
-        body_style = ParagraphStyle(
-            'CustomBody',
-            parent=styles['Normal'],
-            fontSize=10,
-            spaceAfter=12,
-            alignment=TA_JUSTIFY
-        )
-        
-        # Add logo if provided
-        if logo_file is not None:
-            try:
-                logo_file.seek(0)  # Reset file pointer
-                logo_image = Image(logo_file, width=3*inch, height=1.5*inch)
-                logo_image.hAlign = 'CENTER'
-                elements.append(logo_image)
-                elements.append(Spacer(1, 20))
-            except Exception:
-                # Logo placeholder if fails
-                logo_placeholder = Paragraph("Company Logo", 
-                    ParagraphStyle('LogoPlaceholder', parent=styles['Normal'], 
-                                 fontSize=12, alignment=TA_CENTER, textColor=colors.grey))
-                elements.append(logo_placeholder)
-                elements.append(Spacer(1, 20))
-        
-        # Title
-        elements.append(Paragraph("Business Value Assessment Report", title_style))
-        elements.append(Paragraph(f"{solution_name} Implementation", title_style))
-        elements.append(Spacer(1, 30))
-        
-        # Executive Summary
-        elements.append(Paragraph("Executive Summary", heading_style))
-        
-        expected_result = scenario_results['Expected']
-        total_asset_savings = asset_discovery_savings
-        exec_summary = f"""
-        This comprehensive business value assessment analyzes the financial impact of implementing {solution_name} 
-        over a {evaluation_years}-year period. Our analysis shows a projected NPV of {currency_symbol}{expected_result['npv']:,.0f} 
-        with an ROI of {expected_result['roi']*100:.1f}%. The payback period is estimated at {expected_result['payback_months']}.
-        
-        <br/><br/>
-        The implementation will process {alert_volume:,} alerts and {incident_volume:,} incidents annually, with projected 
-        reductions of {alert_reduction_pct}% and {incident_reduction_pct}% respectively. Major incident MTTR improvements of 
-        {mttr_improvement_pct}% will deliver significant operational benefits.
-        
-        <br/><br/>
-        <b>Asset Discovery Value:</b> The solution will also automate asset discovery processes, 
-        delivering an additional {currency_symbol}{total_asset_savings:,.0f} in annual value through improved IT asset management.
-        
-        <br/><br/>
-        <b>Key Recommendation:</b> Proceed with implementation based on strong financial justification and strategic benefits.
-        """
-        elements.append(Paragraph(exec_summary, body_style))
-        elements.append(Spacer(1, 20))
-        
-        # Key Financial Metrics
-        elements.append(Paragraph("Key Financial Metrics", heading_style))
-        
-        total_investment = platform_cost * evaluation_years + services_cost
-        metrics_data = [
-            ['Metric', 'Value', 'Description'],
-            ['Net Present Value (NPV)', f'{currency_symbol}{expected_result["npv"]:,.0f}', 'Total value in current dollars'],
-            ['Return on Investment (ROI)', f'{expected_result["roi"]*100:.1f}%', 'Percentage return over investment'],
-            ['Payback Period', f'{expected_result["payback_months"]}', 'Time to recover initial investment'],
-            ['Total Annual Benefits', f'{currency_symbol}{total_annual_benefits:,.0f}', 'Expected yearly value creation'],
-            ['Total Investment', f'{currency_symbol}{total_investment:,.0f}', 'Total cost over evaluation period'],
-            ['Equivalent FTEs Gained', f'{equivalent_ftes:.1f} FTEs', 'Strategic capacity from savings']
-        ]
-        
-        metrics_table = Table(metrics_data, colWidths=[2.2*inch, 1.8*inch, 2.5*inch])
-        metrics_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 1), (-1, -1), 9),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
-        elements.append(metrics_table)
-        elements.append(Spacer(1, 20))
-        
-        # Scenario Analysis
-        elements.append(Paragraph("Scenario Analysis", heading_style))
-        
-        scenario_data = [['Scenario', 'NPV', 'ROI', 'Payback', 'Description']]
-        for name, result in scenario_results.items():
-            scenario_data.append([
-                name,
-                f'{currency_symbol}{result["npv"]:,.0f}',
-                f'{result["roi"]*100:.1f}%',
-                result["payback_months"],
-                result["description"]
-            ])
-        
-        scenario_table = Table(scenario_data, colWidths=[1*inch, 1.2*inch, 0.8*inch, 1*inch, 2.5*inch])
-        scenario_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.darkgreen),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 9),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.lightgrey),
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 1), (-1, -1), 8),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
-        elements.append(scenario_table)
-        elements.append(Spacer(1, 20))
-        
-        # Benefits Breakdown
-        elements.append(Paragraph("Annual Benefits Breakdown", heading_style))
-        
-        benefits_data = [['Benefit Category', 'Annual Value', 'Percentage']]
-        benefit_categories = [
-            ('Alert Reduction Savings', alert_reduction_savings),
-            ('Alert Triage Efficiency', alert_triage_savings),
-            ('Incident Reduction Savings', incident_reduction_savings),
-            ('Incident Triage Efficiency', incident_triage_savings),
-            ('MTTR Improvement', major_incident_savings),
-            ('Asset Discovery Automation', asset_discovery_savings),
-            ('Tool Consolidation', tool_savings),
-            ('People Efficiency', people_efficiency),
-            ('FTE Avoidance', fte_avoidance),
-            ('Other Benefits', other_benefits)
-        ]
-        
-        for category, value in benefit_categories:
-            if value > 0:
-                percentage = (value / total_annual_benefits * 100) if total_annual_benefits > 0 else 0
-                benefits_data.append([category, f'{currency_symbol}{value:,.0f}', f'{percentage:.1f}%'])
-        
-        if len(benefits_data) == 1:
-            benefits_data.append(['Total Benefits', f'{currency_symbol}{total_annual_benefits:,.0f}', '100.0%'])
-        
-        benefits_table = Table(benefits_data, colWidths=[3*inch, 1.5*inch, 1*inch])
-        benefits_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.darkorange),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('ALIGN', (1, 1), (-1, -1), 'RIGHT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.lightyellow),
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 1), (-1, -1), 9),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
-        elements.append(benefits_table)
-        elements.append(Spacer(1, 20))
-        
-        # Footer
-        footer_text = f"Report generated on {datetime.now().strftime('%B %d, %Y')} using Enhanced Business Value Assessment Tool v2.3"
-        footer_style = ParagraphStyle(
-            'Footer',
-            parent=styles['Normal'],
-            fontSize=8,
-            textColor=colors.grey,
-            alignment=TA_CENTER
-        )
-        elements.append(Paragraph(footer_text, footer_style))
-        
-        # Build PDF
-        doc.build(elements)
-        
-        pdf_data = buffer.getvalue()
-        buffer.close()
-        
-        return pdf_data, None
+        return build_executive_pdf_report(
+            solution_name=solution_name,
+            currency_symbol=currency_symbol,
+            evaluation_years=evaluation_years,
+            alert_volume=alert_volume,
+            incident_volume=incident_volume,
+            alert_reduction_pct=alert_reduction_pct,
+            incident_reduction_pct=incident_reduction_pct,
+            mttr_improvement_pct=mttr_improvement_pct,
+            platform_cost=platform_cost,
+            services_cost=services_cost,
+            total_annual_benefits=total_annual_benefits,
+            alert_reduction_savings=alert_reduction_savings,
+            incident_reduction_savings=incident_reduction_savings,
+            major_incident_savings=major_incident_savings,
+            alert_triage_savings=alert_triage_savings,
+            incident_triage_savings=incident_triage_savings,
+            tool_savings=tool_savings,
+            people_efficiency=people_efficiency,
+            fte_avoidance=fte_avoidance,
+            other_benefits=other_benefits,
+            equivalent_ftes=equivalent_ftes,
+            asset_discovery_savings=asset_discovery_savings,
+            scenario_results=scenario_results,
+            report_date=datetime.now().strftime('%B %d, %Y'),
+            logo_bytes=logo_file.getvalue() if logo_file is not None else None
+        ), None
         
     except Exception as e:
         return None, f"Error generating PDF: {str(e)}"
 
+@st.cache_data(show_spinner=False, max_entries=8)
+def build_executive_pdf_report(solution_name, currency_symbol, evaluation_years, alert_volume, incident_volume,
+                               alert_reduction_pct, incident_reduction_pct, mttr_improvement_pct,
+                               platform_cost, services_cost, total_annual_benefits,
+                               alert_reduction_savings, incident_reduction_savings, major_incident_savings,
+                               alert_triage_savings, incident_triage_savings, tool_savings, people_efficiency,
+                               fte_avoidance, other_benefits, equivalent_ftes, asset_discovery_savings,
+                               scenario_results, report_date, logo_bytes=None):
+    """Render the executive summary PDF; cached so unchanged inputs reuse the previous document bytes"""
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import letter
+    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.units import inch
+    from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
+
+    # Create PDF
+    buffer = BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=letter, rightMargin=72, leftMargin=72, 
+                           topMargin=72, bottomMargin=18)
+    elements = []
+    styles = getSampleStyleSheet()
+
+    # Define custom styles
+    title_style = ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=24,
+        textColor=colors.darkblue,
+        spaceAfter=30,
+        alignment=TA_CENTER
+    )
+
+    heading_style = ParagraphStyle(
+        'CustomHeading',
+        parent=styles['Heading2'],
+        fontSize=16,
+        textColor=colors.darkblue,
+        spaceBefore=20,
+        spaceAfter=12
+    )
+
+    body_style = ParagraphStyle(
+        'CustomBody',
+        parent=styles['Normal'],
+        fontSize=10,
+        spaceAfter=12,
+        alignment=TA_JUSTIFY
+    )
+
+    # Add logo if provided
+    if logo_bytes is not None:
+        try:
+            logo_image = Image(BytesIO(logo_bytes), width=3*inch, height=1.5*inch)
+            logo_image.hAlign = 'CENTER'
+            elements.append(logo_image)
+            elements.append(Spacer(1, 20))
+        except Exception:
+            # Logo placeholder if fails
+            logo_placeholder = Paragraph("Company Logo", 
+                ParagraphStyle('LogoPlaceholder', parent=styles['Normal'], 
+                             fontSize=12, alignment=TA_CENTER, textColor=colors.grey))
+            elements.append(logo_placeholder)
+            elements.append(Spacer(1, 20))
+
+    # Title
+    elements.append(Paragraph("Business Value Assessment Report", title_style))
+    elements.append(Paragraph(f"{solution_name} Implementation", title_style))
+    elements.append(Spacer(1, 30))
+
+    # Executive Summary
+    elements.append(Paragraph("Executive Summary", heading_style))
+
+    expected_result = scenario_results['Expected']
+    total_asset_savings = asset_discovery_savings
+    exec_summary = f"""
+    This comprehensive business value assessment analyzes the financial impact of implementing {solution_name} 
+    over a {evaluation_years}-year period. Our analysis shows a projected NPV of {currency_symbol}{expected_result['npv']:,.0f} 
+    with an ROI of {expected_result['roi']*100:.1f}%. The payback period is estimated at {expected_result['payback_months']}.
+
+    <br/><br/>
+    The implementation will process {alert_volume:,} alerts and {incident_volume:,} incidents annually, with projected 
+    reductions of {alert_reduction_pct}% and {incident_reduction_pct}% respectively. Major incident MTTR improvements of 
+    {mttr_improvement_pct}% will deliver significant operational benefits.
+
+    <br/><br/>
+    <b>Asset Discovery Value:</b> The solution will also automate asset discovery processes, 
+    delivering an additional {currency_symbol}{total_asset_savings:,.0f} in annual value through improved IT asset management.
+
+    <br/><br/>
+    <b>Key Recommendation:</b> Proceed with implementation based on strong financial justification and strategic benefits.
+    """
+    elements.append(Paragraph(exec_summary, body_style))
+    elements.append(Spacer(1, 20))
+
+    # Key Financial Metrics
+    elements.append(Paragraph("Key Financial Metrics", heading_style))
+
+    # Reuse one bound formatter for every currency cell in the report tables
+    format_currency = '{}{:,.0f}'.format
+    total_investment = platform_cost * evaluation_years + services_cost
+    metrics_data = [
+        ['Metric', 'Value', 'Description'],
+        ['Net Present Value (NPV)', format_currency(currency_symbol, expected_result["npv"]), 'Total value in current dollars'],
+        ['Return on Investment (ROI)', f'{expected_result["roi"]*100:.1f}%', 'Percentage return over investment'],
+        ['Payback Period', f'{expected_result["payback_months"]}', 'Time to recover initial investment'],
+        ['Total Annual Benefits', format_currency(currency_symbol, total_annual_benefits), 'Expected yearly value creation'],
+        ['Total Investment', format_currency(currency_symbol, total_investment), 'Total cost over evaluation period'],
+        ['Equivalent FTEs Gained', f'{equivalent_ftes:.1f} FTEs', 'Strategic capacity from savings']
+    ]
+
+    metrics_table = Table(metrics_data, colWidths=[2.2*inch, 1.8*inch, 2.5*inch])
+    metrics_table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 1), (-1, -1), 9),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black)
+    ]))
+    elements.append(metrics_table)
+    elements.append(Spacer(1, 20))
+
+    # Scenario Analysis
+    elements.append(Paragraph("Scenario Analysis", heading_style))
+
+    scenario_data = [['Scenario', 'NPV', 'ROI', 'Payback', 'Description']]
+    for name, result in scenario_results.items():
+        scenario_data.append([
+            name,
+            format_currency(currency_symbol, result["npv"]),
+            f'{result["roi"]*100:.1f}%',
+            result["payback_months"],
+            result["description"]
+        ])
+
+    scenario_table = Table(scenario_data, colWidths=[1*inch, 1.2*inch, 0.8*inch, 1*inch, 2.5*inch])
+    scenario_table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.darkgreen),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 9),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.lightgrey),
+        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 1), (-1, -1), 8),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black)
+    ]))
+    elements.append(scenario_table)
+    elements.append(Spacer(1, 20))
+
+    # Benefits Breakdown
+    elements.append(Paragraph("Annual Benefits Breakdown", heading_style))
+
+    benefits_data = [['Benefit Category', 'Annual Value', 'Percentage']]
+    benefit_categories = [
+        ('Alert Reduction Savings', alert_reduction_savings),
+        ('Alert Triage Efficiency', alert_triage_savings),
+        ('Incident Reduction Savings', incident_reduction_savings),
+        ('Incident Triage Efficiency', incident_triage_savings),
+        ('MTTR Improvement', major_incident_savings),
+        ('Asset Discovery Automation', asset_discovery_savings),
+        ('Tool Consolidation', tool_savings),
+        ('People Efficiency', people_efficiency),
+        ('FTE Avoidance', fte_avoidance),
+        ('Other Benefits', other_benefits)
+    ]
+
+    for category, value in benefit_categories:
+        if value > 0:
+            percentage = (value / total_annual_benefits * 100) if total_annual_benefits > 0 else 0
+            benefits_data.append([category, format_currency(currency_symbol, value), f'{percentage:.1f}%'])
+
+    if len(benefits_data) == 1:
+        benefits_data.append(['Total Benefits', format_currency(currency_symbol, total_annual_benefits), '100.0%'])
+
+    benefits_table = Table(benefits_data, colWidths=[3*inch, 1.5*inch, 1*inch])
+    benefits_table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.darkorange),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('ALIGN', (1, 1), (-1, -1), 'RIGHT'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.lightyellow),
+        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 1), (-1, -1), 9),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black)
+    ]))
+    elements.append(benefits_table)
+    elements.append(Spacer(1, 20))
+
+    # Footer
+    footer_text = f"Report generated on {report_date} using Enhanced Business Value Assessment Tool v2.3"
+    footer_style = ParagraphStyle(
+        'Footer',
+        parent=styles['Normal'],
+        fontSize=8,
+        textColor=colors.grey,
+        alignment=TA_CENTER
+    )
+    elements.append(Paragraph(footer_text, footer_style))
+
+    # Build PDF
+    doc.build(elements)
+
+    pdf_data = buffer.getvalue()
+    buffer.close()
+
+    return pdf_data
+
 # --- CALCULATION FUNCTIONS ---
 
+# Scenario descriptions, shared by the scenario definitions and the PDF report fallback
+SCENARIO_DESCRIPTIONS = {
+    "Conservative": "Benefits 30% lower, implementation 30% longer",
+    "Expected": "Baseline assumptions as entered",
+    "Optimistic": "Benefits 20% higher, implementation 20% faster",
+}
+
 def calculate_alert_costs(alert_volume, alert_ftes, avg_alert_triage_time, avg_salary_per_year, 
                          hours_per_day, days_per_week, weeks_per_year, holiday_sick_days,
                          alert_fte_time_pct):
@@ -1484,84 +1647,85 @@ def calculate_asset_discovery_costs(asset_volume, manual_discovery_cycles_per_ye
     
     return cost_per_discovery_cycle, total_discovery_cost, utilization_of_allocated_time, working_hours_per_fte_per_year
 
-def calculate_benefit_realization_factor(month, implementation_delay_months, ramp_up_months):
-    """Calculate what percentage of benefits are realized in a given month"""
-    if month <= implementation_delay_months:
-        return 0.0  # No benefits during implementation
-    elif month <= implementation_delay_months + ramp_up_months:
-        # Linear ramp-up during ramp-up period
-        months_since_golive = month - implementation_delay_months
-        return months_since_golive / ramp_up_months
+def calculate_volume_savings(volume, reduction_pct, cost_per_unit, triage_time_saved_pct):
+    """Calculate avoided/remaining volume and the reduction and triage savings for alerts or incidents"""
+    avoided = volume * (reduction_pct / 100)
+    remaining = volume - avoided
+    reduction_savings = avoided * cost_per_unit
+    remaining_handling_cost = remaining * cost_per_unit
+    triage_savings = remaining_handling_cost * (triage_time_saved_pct / 100)
+    return avoided, remaining, reduction_savings, triage_savings
+
+def calculate_monthly_factors(months, implementation_delay_months, ramp_up_months, billing_start_month):
+    """Vectorized benefit realization and platform cost factors for an array of month numbers"""
+    # Benefits are zero until go-live, ramp linearly, then stay at 100%; billing is on from its start month
+    months = np.asarray(months)
+    if ramp_up_months > 0:
+        benefit_factors = np.clip((months - implementation_delay_months) / ramp_up_months, 0.0, 1.0)
     else:
-        return 1.0  # Full benefits realized
+        benefit_factors = (months > implementation_delay_months).astype(float)
+    cost_factors = (months >= billing_start_month).astype(float)
+    return benefit_factors, cost_factors
+
+def calculate_yearly_cash_flows(annual_benefits, platform_cost, services_cost, monthly_benefit_factors, monthly_cost_factors):
+    """Calculate yearly cash flows (one array per column, one entry per year) from monthly benefit and billing factors"""
+    # Average the monthly factors per year
+    evaluation_years = len(monthly_benefit_factors) // 12
+    avg_benefit_realization_factors = monthly_benefit_factors.reshape(evaluation_years, 12).mean(axis=1)
+    avg_cost_factors = monthly_cost_factors.reshape(evaluation_years, 12).mean(axis=1)
+    
+    years = np.arange(1, evaluation_years + 1)
+    year_benefits = annual_benefits * avg_benefit_realization_factors
+    year_platform_costs = platform_cost * avg_cost_factors  # Only pay for months when billing is active
+    year_services_costs = np.where(years == 1, services_cost, 0)
+    year_net_cash_flows = year_benefits - year_platform_costs - year_services_costs
+    
+    return {
+        'year': years,
+        'benefits': year_benefits,
+        'platform_cost': year_platform_costs,
+        'services_cost': year_services_costs,
+        'net_cash_flow': year_net_cash_flows,
+        'benefit_realization_factor': avg_benefit_realization_factors,
+        'cost_factor': avg_cost_factors
+    }
 
-def calculate_platform_cost_factor(month, billing_start_month):
-    """Calculate whether platform costs are incurred in a given month"""
-    return 1.0 if month >= billing_start_month else 0.0
+def calculate_discount_factors(evaluation_years, discount_rate):
+    """Year-end discount factors 1/(1+r)^1 .. 1/(1+r)^n, accumulated as a geometric series"""
+    return np.cumprod(np.full(evaluation_years, 1 / (1 + discount_rate)))
 
-def calculate_scenario_results(benefits_multiplier, implementation_delay_multiplier, scenario_name, billing_start_month):
-    """Calculate NPV, ROI, and payback for a given scenario"""
-    # Get values from session state
-    total_annual_benefits = st.session_state.get('total_annual_benefits', 100000)
-    implementation_delay_months = st.session_state.get('implementation_delay', 6)
-    benefits_ramp_up_months = st.session_state.get('benefits_ramp_up', 3)
-    platform_cost = st.session_state.get('platform_cost', 0)
-    services_cost = st.session_state.get('services_cost', 0)
-    evaluation_years = st.session_state.get('evaluation_years', 3)
-    discount_rate = st.session_state.get('discount_rate', 10) / 100
-    
+def calculate_present_values(cash_flows, discount_rate):
+    """Discount every year's net cash flow at once; returns (discount factors, present values) as arrays"""
+    discount_factors = calculate_discount_factors(len(cash_flows['year']), discount_rate)
+    return discount_factors, cash_flows['net_cash_flow'] * discount_factors
+
+@st.cache_data(show_spinner=False)
+def calculate_scenario_results(benefits_multiplier, implementation_delay_multiplier, scenario_name, billing_start_month,
+                               total_annual_benefits, implementation_delay_months, benefits_ramp_up_months,
+                               platform_cost, services_cost, evaluation_years, discount_rate):
+    """Calculate NPV, ROI, and payback for a given scenario (discount_rate as a fraction)"""
     # Adjust benefits and timeline
     scenario_benefits = total_annual_benefits * benefits_multiplier
     scenario_impl_delay = max(0, int(implementation_delay_months * implementation_delay_multiplier))
     scenario_ramp_up = benefits_ramp_up_months
     
-    # Calculate cash flows
-    scenario_cash_flows = []
-    for year in range(1, evaluation_years + 1):
-        year_start_month = (year - 1) * 12 + 1
-        year_end_month = year * 12
-        
-        # Calculate monthly factors and average for the year
-        monthly_benefit_factors = []
-        monthly_cost_factors = []
-        
-        for month in range(year_start_month, year_end_month + 1):
-            benefit_factor = calculate_benefit_realization_factor(month, scenario_impl_delay, scenario_ramp_up)
-            cost_factor = calculate_platform_cost_factor(month, billing_start_month)
-            monthly_benefit_factors.append(benefit_factor)
-            monthly_cost_factors.append(cost_factor)
-        
-        avg_benefit_realization_factor = np.mean(monthly_benefit_factors)
-        avg_cost_factor = np.mean(monthly_cost_factors)
-        
-        year_benefits = scenario_benefits * avg_benefit_realization_factor
-        year_platform_cost = platform_cost * avg_cost_factor  # Only pay for months when billing is active
-        year_services_cost = services_cost if year == 1 else 0
-        year_net_cash_flow = year_benefits - year_platform_cost - year_services_cost
-        
-        scenario_cash_flows.append({
-            'year': year,
-            'benefits': year_benefits,
-            'platform_cost': year_platform_cost,
-            'services_cost': year_services_cost,
-            'net_cash_flow': year_net_cash_flow,
-            'benefit_realization_factor': avg_benefit_realization_factor,
-            'cost_factor': avg_cost_factor
-        })
+    # Calculate monthly factors for the whole evaluation period, then yearly cash flows
+    monthly_benefit_factors, monthly_cost_factors = calculate_monthly_factors(
+        np.arange(1, evaluation_years * 12 + 1), scenario_impl_delay, scenario_ramp_up, billing_start_month)
+    scenario_cash_flows = calculate_yearly_cash_flows(scenario_benefits, platform_cost, services_cost,
+                                                      monthly_benefit_factors, monthly_cost_factors)
     
     # Calculate metrics
-    scenario_npv = sum([cf['net_cash_flow'] / ((1 + discount_rate) ** cf['year']) for cf in scenario_cash_flows])
-    scenario_tco = sum([cf['platform_cost'] + cf['services_cost'] for cf in scenario_cash_flows])
+    discount_factors, present_values = calculate_present_values(scenario_cash_flows, discount_rate)
+    scenario_npv = present_values.sum()
+    scenario_total_benefits = scenario_cash_flows['benefits'].sum()
+    scenario_total_platform_cost = scenario_cash_flows['platform_cost'].sum()
+    scenario_tco = (scenario_cash_flows['platform_cost'] + scenario_cash_flows['services_cost']).sum()
     scenario_roi = scenario_npv / scenario_tco if scenario_tco != 0 else 0
     
-    # Calculate payback
-    scenario_payback = "N/A"
-    cumulative_net_cash_flow = 0
-    for cf in scenario_cash_flows:
-        cumulative_net_cash_flow += cf['net_cash_flow']
-        if cumulative_net_cash_flow >= 0:
-            scenario_payback = f"{cf['year']} years"
-            break
+    # Calculate payback - first year whose cumulative net cash flow is non-negative
+    payback_positions = np.flatnonzero(np.cumsum(scenario_cash_flows['net_cash_flow']) >= 0)
+    scenario_payback = f"{scenario_cash_flows['year'][payback_positions[0]]} years" if payback_positions.size else "N/A"
     
     return {
         'npv': scenario_npv,
@@ -1570,37 +1734,61 @@ def calculate_scenario_results(benefits_multiplier, implementation_delay_multipl
         'impl_delay': scenario_impl_delay,
         'benefits_mult': benefits_multiplier,
         'cash_flows': scenario_cash_flows,
+        'monthly_benefit_factors': monthly_benefit_factors,
+        'monthly_cost_factors': monthly_cost_factors,
+        'discount_factors': discount_factors,
+        'present_values': present_values,
+        'total_benefits': scenario_total_benefits,
+        'total_platform_cost': scenario_total_platform_cost,
+        'total_cost': scenario_tco,
         'annual_benefits': scenario_benefits
     }
 
+def find_payback_month(monthly_net_cash_flows, initial_cash_flow):
+    """Return the first month (1-based) where the cumulative cash flow is non-negative, or 0 if it never is"""
+    cumulative_cash_flow = initial_cash_flow
+    for i in range(monthly_net_cash_flows.shape[0]):
+        cumulative_cash_flow += monthly_net_cash_flows[i]
+        if cumulative_cash_flow >= 0:
+            return i + 1
+    return 0
+
+if NUMBA_AVAILABLE:
+    find_payback_month = njit(cache=True)(find_payback_month)
+
+@st.cache_data(show_spinner=False)
 def calculate_payback_months(annual_benefits, annual_platform_cost, one_time_services_cost, 
                              implementation_delay_months, benefits_ramp_up_months, billing_start_month, max_months_eval=60):
     """Calculates the payback period in months."""
-    
-    cumulative_cash_flow = 0
-    payback_month = "N/A"
-    
     # Initial investment (services cost) incurred at the beginning
-    cumulative_cash_flow -= one_time_services_cost
-
-    for month in range(1, max_months_eval + 1):
-        # Benefits start based on implementation timeline
-        benefit_factor = calculate_benefit_realization_factor(month, implementation_delay_months, benefits_ramp_up_months)
-        # Platform costs start based on billing timeline
-        cost_factor = calculate_platform_cost_factor(month, billing_start_month)
-        
-        monthly_benefit = (annual_benefits / 12) * benefit_factor
-        monthly_platform_cost = (annual_platform_cost / 12) * cost_factor
-        
-        monthly_net_cash_flow = monthly_benefit - monthly_platform_cost
-        
-        cumulative_cash_flow += monthly_net_cash_flow
-        
-        if cumulative_cash_flow >= 0:
-            payback_month = f"{month} months"
-            break
-            
-    return payback_month
+    initial_cash_flow = float(-one_time_services_cost)
+    
+    # Benefits ramp up and billing starts during the first months; scan those month by month
+    transient_months = min(max_months_eval, max(implementation_delay_months + benefits_ramp_up_months, billing_start_month - 1))
+    months = np.arange(1, transient_months + 1)
+    benefit_factors, cost_factors = calculate_monthly_factors(
+        months, implementation_delay_months, benefits_ramp_up_months, billing_start_month)
+    monthly_net_cash_flows = (annual_benefits / 12) * benefit_factors - (annual_platform_cost / 12) * cost_factors
+    
+    payback_month = find_payback_month(monthly_net_cash_flows, initial_cash_flow)
+    if payback_month:
+        return f"{payback_month} months"
+    
+    # After that the monthly net cash flow is constant, so solve for the crossing month directly
+    cumulative_cash_flow = initial_cash_flow + monthly_net_cash_flows.sum()
+    steady_net_cash_flow = annual_benefits / 12 - annual_platform_cost / 12
+    if cumulative_cash_flow + steady_net_cash_flow >= 0:
+        # The first month after the transient window closes the gap (this also covers no transient window at all,
+        # e.g. no delay, ramp or billing offset with no services cost)
+        months_to_payback = 1
+    elif steady_net_cash_flow > 0:
+        # The small tolerance keeps exact break-even months from being pushed out by rounding
+        months_to_payback = max(1, int(np.ceil(-cumulative_cash_flow / steady_net_cash_flow - 1e-9)))
+    else:
+        return "N/A"
+    
+    payback_month = transient_months + months_to_payback
+    return f"{payback_month} months" if payback_month <= max_months_eval else "N/A"
 
 def create_implementation_timeline_chart(implementation_delay_months, ramp_up_months, billing_start_month, evaluation_years, currency_symbol, total_annual_benefits):
     """Create a visual timeline showing benefit realization and cost timeline over time"""
@@ -1609,18 +1797,13 @@ def create_implementation_timeline_chart(implementation_delay_months, ramp_up_mo
     platform_cost = st.session_state.get('platform_cost', 0)
     
     total_months = evaluation_years * 12
-    months = list(range(1, total_months + 1))
-    benefit_realization_factors = []
-    monthly_benefits = []
-    monthly_costs = []
-    
-    for month in months:
-        benefit_factor = calculate_benefit_realization_factor(month, implementation_delay_months, ramp_up_months)
-        cost_factor = calculate_platform_cost_factor(month, billing_start_month)
-        
-        benefit_realization_factors.append(benefit_factor * 100)
-        monthly_benefits.append(total_annual_benefits * benefit_factor / 12)
-        monthly_costs.append(platform_cost * cost_factor / 12)
+    months = np.arange(1, total_months + 1)
+    benefit_factors, cost_factors = calculate_monthly_factors(months, implementation_delay_months, ramp_up_months, billing_start_month)
+    
+    # Scale the monthly factors into chart series in one pass
+    benefit_realization_factors = benefit_factors * 100
+    monthly_benefits = total_annual_benefits * benefit_factors / 12
+    monthly_costs = platform_cost * cost_factors / 12
     
     fig = go.Figure()
     
@@ -1634,7 +1817,7 @@ def create_implementation_timeline_chart(implementation_delay_months, ramp_up_mo
     
     # Benefits area
     fig.add_trace(go.Scatter(
-        x=months, y=[b/1000 for b in monthly_benefits], mode='lines', name=f'Monthly Benefits ({currency_symbol}K)',
+        x=months, y=monthly_benefits / 1000, mode='lines', name=f'Monthly Benefits ({currency_symbol}K)',
         line=dict(color='#A23B72', width=2), fill='tonexty', fillcolor='rgba(162, 59, 114, 0.2)',
         hovertemplate='<b>Month %{x}</b><br>' + f'Monthly Benefit: {currency_symbol}' + '%{customdata:,.0f}<br><extra></extra>',
         customdata=monthly_benefits, yaxis='y2'
@@ -1642,7 +1825,7 @@ def create_implementation_timeline_chart(implementation_delay_months, ramp_up_mo
     
     # Platform costs line
     fig.add_trace(go.Scatter(
-        x=months, y=[c/1000 for c in monthly_costs], mode='lines', name=f'Monthly Platform Costs ({currency_symbol}K)',
+        x=months, y=monthly_costs / 1000, mode='lines', name=f'Monthly Platform Costs ({currency_symbol}K)',
         line=dict(color='#FF6B6B', width=2, dash='dash'),
         hovertemplate='<b>Month %{x}</b><br>' + f'Monthly Platform Cost: {currency_symbol}' + '%{customdata:,.0f}<br><extra></extra>',
         customdata=monthly_costs, yaxis='y2'
@@ -1682,22 +1865,11 @@ def create_enhanced_implementation_timeline_chart(implementation_delay_months, r
     """Create an enhanced visual timeline showing benefit realization progress"""
     
     total_months = evaluation_years * 12
-    months = list(range(0, total_months + 1))  # Start from month 0
+    months = np.arange(0, total_months + 1)  # Start from month 0
     
-    # Initialize arrays
-    benefit_realization_factors = []
-    
-    # Calculate values for each month
-    for month in months:
-        if month == 0:
-            # Month 0: Initial setup
-            benefit_factor = 0
-        else:
-            # Calculate factors for month
-            benefit_factor = calculate_benefit_realization_factor(month, implementation_delay_months, ramp_up_months)
-        
-        # Store values
-        benefit_realization_factors.append(benefit_factor * 100)
+    # Calculate benefit realization for every month at once (month 0 is initial setup, always 0%)
+    benefit_factors, _ = calculate_monthly_factors(months, implementation_delay_months, ramp_up_months, billing_start_month)
+    benefit_realization_factors = benefit_factors * 100
     
     # Create single chart
     fig = go.Figure()
@@ -1885,7 +2057,7 @@ def create_timeline_summary_metrics(scenario_results, currency_symbol, implement
     
     with col4:
         if 'cash_flows' in expected_result:
-            max_monthly_benefit = max([cf['benefits']/12 for cf in expected_result['cash_flows']])
+            max_monthly_benefit = expected_result['cash_flows']['benefits'].max() / 12
             st.metric(
                 "Peak Monthly Benefit",
                 f"{currency_symbol}{max_monthly_benefit:,.0f}",
@@ -1989,7 +2161,7 @@ with st.sidebar.expander("📄 Generate Executive Summary"):
     
     if st.button("Generate PDF Executive Summary", key="generate_pdf"):
         if not REPORT_DEPENDENCIES_AVAILABLE:
-            st.error("❌ PDF generation requires additional dependencies. Please install reportlab and matplotlib.")
+            st.error("❌ PDF generation requires additional dependencies. Please install reportlab.")
         else:
             with st.spinner("Generating PDF executive summary..."):
                 try:
@@ -2024,7 +2196,8 @@ st.sidebar.header("🔄 Configuration Export/Import")
 with st.sidebar.expander("📤 Export Configuration"):
     st.write("Export your current configuration to save or share with others.")
     
-    export_format = st.selectbox("Export Format", ["CSV", "JSON"], key="export_format")
+    export_format = st.selectbox("Export Format", ["CSV", "JSON", "Parquet"] if PARQUET_AVAILABLE else ["CSV", "JSON"],
+                                 key="export_format")
     
     if st.button("Generate Export File"):
         current_values = get_all_input_values()
@@ -2033,6 +2206,10 @@ with st.sidebar.expander("📤 Export Configuration"):
             export_data = export_to_csv(current_values)
             file_extension = "csv"
             mime_type = "text/csv"
+        elif export_format == "Parquet":
+            export_data = export_to_parquet(current_values)
+            file_extension = "parquet"
+            mime_type = "application/vnd.apache.parquet"
         else:  # JSON
             export_data = export_to_json(current_values)
             file_extension = "json"
@@ -2055,25 +2232,33 @@ with st.sidebar.expander("📥 Import Configuration"):
     
     uploaded_file = st.file_uploader(
         "Choose configuration file",
-        type=['csv', 'json'],
-        help="Upload a CSV or JSON configuration file"
+        type=['csv', 'json', 'parquet'] if PARQUET_AVAILABLE else ['csv', 'json'],
+        help="Upload a CSV, JSON or Parquet configuration file" if PARQUET_AVAILABLE else "Upload a CSV or JSON configuration file"
     )
     
     if uploaded_file is not None:
         try:
             # Read file content
-            file_content = uploaded_file.read().decode('utf-8')
+            file_bytes = uploaded_file.read()
             file_extension = uploaded_file.name.split('.')[-1].lower()
             
             if st.button("Import Configuration"):
-                if file_extension == 'csv':
-                    success, message = import_from_csv(file_content)
+                # Skip re-applying a file that is already loaded and unchanged since
+                file_hash = hashlib.blake2b(file_bytes, digest_size=16).hexdigest()
+                if st.session_state.get('_last_cfg_hash') == file_hash:
+                    success, message = True, "Configuration already imported - no changes applied"
+                elif file_extension == 'csv':
+                    success, message = import_from_csv(file_bytes.decode('utf-8'))
                 elif file_extension == 'json':
-                    success, message = import_from_json(file_content)
+                    # JSON parsers accept the raw UTF-8 bytes directly
+                    success, message = import_from_json(file_bytes)
+                elif file_extension == 'parquet' and PARQUET_AVAILABLE:
+                    success, message = import_from_parquet(file_bytes)
                 else:
                     success, message = False, "Unsupported file format"
                 
                 if success:
+                    st.session_state['_last_cfg_hash'] = file_hash
                     st.success(message)
                     st.info("Please scroll down to see the imported values. You may need to refresh the page to see all changes.")
                 else:
@@ -2087,370 +2272,376 @@ st.sidebar.markdown("---")
 # --- Sidebar Inputs ---
 st.sidebar.header("Customize Your Financial Impact Model Inputs")
 
-# Solution Name Input
-solution_name = st.sidebar.text_input("Customer Name", value="ACME", key="solution_name")
-
-# --- Implementation Timeline ---
-st.sidebar.subheader("📅 Implementation Timeline")
-implementation_delay_months = st.sidebar.slider(
-    "Implementation Delay (months)", 
-    0, 24, 0, 
-    help="Time from project start until benefits begin to be realized",
-    key="implementation_delay"
-)
-benefits_ramp_up_months = st.sidebar.slider(
-    "Benefits Ramp-up Period (months)", 
-    0, 12, 0,
-    help="Time to reach full benefits after go-live (gradual adoption)",
-    key="benefits_ramp_up"
-)
-billing_start_month = st.sidebar.slider(
-    "Billing Start Month", 
-    1, 24, 1,
-    help="Month when platform subscription billing begins (when customer starts paying monthly fees)",
-    key="billing_start_month"
-)
-st.sidebar.caption("💡 Platform costs start from billing month. Benefits start when implementation completes (independent timelines)")
-
-# --- Industry Benchmark Templates (removed compliance automation) ---
-industry_templates = {
-    "Custom": {},
-    "Financial Services": {
-        "alert_volume": 1_200_000,
-        "major_incident_volume": 140,
-        "avg_alert_triage_time": 25,
-        "alert_reduction_pct": 40,
-        "incident_volume": 400_000,
-        "avg_incident_triage_time": 30,
-        "incident_reduction_pct": 40,
-        "mttr_improvement_pct": 40,
-        # Asset management fields (no CMDB)
-        "asset_volume": 15000,
-        "manual_discovery_cycles_per_year": 4,
-        "hours_per_discovery_cycle": 120,
-        "asset_discovery_automation_pct": 70
-    },
-    "Retail": {
-        "alert_volume": 600_000,
-        "major_incident_volume": 80,
-        "avg_alert_triage_time": 20,
-        "alert_reduction_pct": 30,
-        "incident_volume": 200_000,
-        "avg_incident_triage_time": 25,
-        "incident_reduction_pct": 30,
-        "mttr_improvement_pct": 30,
-        # Asset management fields (no CMDB)
-        "asset_volume": 8000,
-        "manual_discovery_cycles_per_year": 6,
-        "hours_per_discovery_cycle": 80,
-        "asset_discovery_automation_pct": 60
-    },
-    "MSP": {
-        "alert_volume": 2_500_000,
-        "major_incident_volume": 200,
-        "avg_alert_triage_time": 35,
-        "alert_reduction_pct": 50,
-        "incident_volume": 800_000,
-        "avg_incident_triage_time": 35,
-        "incident_reduction_pct": 50,
-        "mttr_improvement_pct": 50,
-        # Asset management fields (no CMDB)
-        "asset_volume": 25000,
-        "manual_discovery_cycles_per_year": 12,
-        "hours_per_discovery_cycle": 200,
-        "asset_discovery_automation_pct": 80
-    },
-    "Healthcare": {
-        "alert_volume": 800_000,
-        "major_incident_volume": 100,
-        "avg_alert_triage_time": 30,
-        "alert_reduction_pct": 35,
-        "incident_volume": 300_000,
-        "avg_incident_triage_time": 30,
-        "incident_reduction_pct": 35,
-        "mttr_improvement_pct": 35,
-        # Asset management fields (no CMDB)
-        "asset_volume": 12000,
-        "manual_discovery_cycles_per_year": 3,
-        "hours_per_discovery_cycle": 100,
-        "asset_discovery_automation_pct": 65
-    },
-    "Telecom": {
-        "alert_volume": 1_800_000,
-        "major_incident_volume": 160,
-        "avg_alert_triage_time": 35,
-        "alert_reduction_pct": 45,
-        "incident_volume": 600_000,
-        "avg_incident_triage_time": 35,
-        "incident_reduction_pct": 40,
-        "mttr_improvement_pct": 45,
-        # Asset management fields (no CMDB)
-        "asset_volume": 20000,
-        "manual_discovery_cycles_per_year": 6,
-        "hours_per_discovery_cycle": 150,
-        "asset_discovery_automation_pct": 75
+# Batch input edits: the model recalculates only when the form is applied
+with st.sidebar.form("inputs", clear_on_submit=False):
+    # Solution Name Input
+    solution_name = st.text_input("Customer Name", value="ACME", key="solution_name")
+
+    # --- Implementation Timeline ---
+    st.subheader("📅 Implementation Timeline")
+    implementation_delay_months = st.slider(
+        "Implementation Delay (months)", 
+        0, 24, 0, 
+        help="Time from project start until benefits begin to be realized",
+        key="implementation_delay"
+    )
+    benefits_ramp_up_months = st.slider(
+        "Benefits Ramp-up Period (months)", 
+        0, 12, 0,
+        help="Time to reach full benefits after go-live (gradual adoption)",
+        key="benefits_ramp_up"
+    )
+    billing_start_month = st.slider(
+        "Billing Start Month", 
+        1, 24, 1,
+        help="Month when platform subscription billing begins (when customer starts paying monthly fees)",
+        key="billing_start_month"
+    )
+    st.caption("💡 Platform costs start from billing month. Benefits start when implementation completes (independent timelines)")
+
+    # --- Industry Benchmark Templates (removed compliance automation) ---
+    industry_templates = {
+        "Custom": {},
+        "Financial Services": {
+            "alert_volume": 1_200_000,
+            "major_incident_volume": 140,
+            "avg_alert_triage_time": 25,
+            "alert_reduction_pct": 40,
+            "incident_volume": 400_000,
+            "avg_incident_triage_time": 30,
+            "incident_reduction_pct": 40,
+            "mttr_improvement_pct": 40,
+            # Asset management fields (no CMDB)
+            "asset_volume": 15000,
+            "manual_discovery_cycles_per_year": 4,
+            "hours_per_discovery_cycle": 120,
+            "asset_discovery_automation_pct": 70
+        },
+        "Retail": {
+            "alert_volume": 600_000,
+            "major_incident_volume": 80,
+            "avg_alert_triage_time": 20,
+            "alert_reduction_pct": 30,
+            "incident_volume": 200_000,
+            "avg_incident_triage_time": 25,
+            "incident_reduction_pct": 30,
+            "mttr_improvement_pct": 30,
+            # Asset management fields (no CMDB)
+            "asset_volume": 8000,
+            "manual_discovery_cycles_per_year": 6,
+            "hours_per_discovery_cycle": 80,
+            "asset_discovery_automation_pct": 60
+        },
+        "MSP": {
+            "alert_volume": 2_500_000,
+            "major_incident_volume": 200,
+            "avg_alert_triage_time": 35,
+            "alert_reduction_pct": 50,
+            "incident_volume": 800_000,
+            "avg_incident_triage_time": 35,
+            "incident_reduction_pct": 50,
+            "mttr_improvement_pct": 50,
+            # Asset management fields (no CMDB)
+            "asset_volume": 25000,
+            "manual_discovery_cycles_per_year": 12,
+            "hours_per_discovery_cycle": 200,
+            "asset_discovery_automation_pct": 80
+        },
+        "Healthcare": {
+            "alert_volume": 800_000,
+            "major_incident_volume": 100,
+            "avg_alert_triage_time": 30,
+            "alert_reduction_pct": 35,
+            "incident_volume": 300_000,
+            "avg_incident_triage_time": 30,
+            "incident_reduction_pct": 35,
+            "mttr_improvement_pct": 35,
+            # Asset management fields (no CMDB)
+            "asset_volume": 12000,
+            "manual_discovery_cycles_per_year": 3,
+            "hours_per_discovery_cycle": 100,
+            "asset_discovery_automation_pct": 65
+        },
+        "Telecom": {
+            "alert_volume": 1_800_000,
+            "major_incident_volume": 160,
+            "avg_alert_triage_time": 35,
+            "alert_reduction_pct": 45,
+            "incident_volume": 600_000,
+            "avg_incident_triage_time": 35,
+            "incident_reduction_pct": 40,
+            "mttr_improvement_pct": 45,
+            # Asset management fields (no CMDB)
+            "asset_volume": 20000,
+            "manual_discovery_cycles_per_year": 6,
+            "hours_per_discovery_cycle": 150,
+            "asset_discovery_automation_pct": 75
+        }
     }
-}
 
-selected_template = st.sidebar.selectbox("Select Industry Template", list(industry_templates.keys()), key="industry_template")
-template = industry_templates[selected_template]
-st.sidebar.caption("📌 Industry templates provide baseline values for estimation only. Adjust any field as needed.")
-
-# --- Currency Selection ---
-currency_symbol = st.sidebar.selectbox("Currency", ["$", "€", "£", "Kč"], key="currency")
-
-# --- Working Hours Configuration ---
-st.sidebar.subheader("⏰ Working Hours Configuration")
-hours_per_day = st.sidebar.number_input(
-    "Working Hours per Day", 
-    value=8.0, 
-    min_value=1.0, 
-    max_value=24.0,
-    step=0.5,
-    key="hours_per_day",
-    help="Standard working hours per day for your FTEs"
-)
-days_per_week = st.sidebar.number_input(
-    "Working Days per Week", 
-    value=5, 
-    min_value=1, 
-    max_value=7,
-    key="days_per_week",
-    help="Standard working days per week"
-)
-weeks_per_year = st.sidebar.number_input(
-    "Working Weeks per Year", 
-    value=52, 
-    min_value=1, 
-    max_value=52,
-    key="weeks_per_year",
-    help="Total weeks worked per year"
-)
-holiday_sick_days = st.sidebar.number_input(
-    "Holiday + Sick Days per Year", 
-    value=25, 
-    min_value=0, 
-    max_value=100,
-    key="holiday_sick_days",
-    help="Total days off per year (holidays, vacation, sick leave)"
-)
+    selected_template = st.selectbox("Select Industry Template", list(industry_templates.keys()), key="industry_template")
+    template = industry_templates[selected_template]
+    st.caption("📌 Industry templates provide baseline values for estimation only. Adjust any field as needed.")
+
+    # --- Currency Selection ---
+    currency_symbol = st.selectbox("Currency", ["$", "€", "£", "Kč"], key="currency")
+
+    # --- Working Hours Configuration ---
+    st.subheader("⏰ Working Hours Configuration")
+    hours_per_day = st.number_input(
+        "Working Hours per Day", 
+        value=8.0, 
+        min_value=1.0, 
+        max_value=24.0,
+        step=0.5,
+        key="hours_per_day",
+        help="Standard working hours per day for your FTEs"
+    )
+    days_per_week = st.number_input(
+        "Working Days per Week", 
+        value=5, 
+        min_value=1, 
+        max_value=7,
+        key="days_per_week",
+        help="Standard working days per week"
+    )
+    weeks_per_year = st.number_input(
+        "Working Weeks per Year", 
+        value=52, 
+        min_value=1, 
+        max_value=52,
+        key="weeks_per_year",
+        help="Total weeks worked per year"
+    )
+    holiday_sick_days = st.number_input(
+        "Holiday + Sick Days per Year", 
+        value=25, 
+        min_value=0, 
+        max_value=100,
+        key="holiday_sick_days",
+        help="Total days off per year (holidays, vacation, sick leave)"
+    )
 
-# Calculate and display total working hours
-total_working_days = (weeks_per_year * days_per_week) - holiday_sick_days
-working_hours_per_fte_per_year = total_working_days * hours_per_day
-st.sidebar.info(f"**Calculated: {working_hours_per_fte_per_year:,.0f} working hours per FTE per year**")
-
-# --- ALERT INPUTS ---
-st.sidebar.subheader("🚨 Alert Management")
-alert_volume = st.sidebar.number_input(
-    "Total Infrastructure Related Alerts Managed per Year", 
-    value=template.get("alert_volume", 0),
-    key="alert_volume"
-)
-alert_ftes = st.sidebar.number_input(
-    "Total FTEs Managing Infrastructure Alerts", 
-    value=0,
-    key="alert_ftes"
-)
-alert_fte_time_pct = st.sidebar.slider(
-    "% of FTE Time on Alerts", 0, 100, 100,
-    help="The percentage of time the above FTEs dedicate specifically to managing these alerts.",
-    key="alert_fte_time_pct"
-)
-avg_alert_triage_time = st.sidebar.number_input(
-    "Average Alert Triage Time (minutes)", 
-    value=template.get("avg_alert_triage_time", 0),
-    key="avg_alert_triage_time"
-)
-avg_alert_fte_salary = st.sidebar.number_input(
-    "Average Annual Salary per Alert Management FTE", 
-    value=0,
-    key="avg_alert_fte_salary"
-)
-alert_reduction_pct = st.sidebar.slider(
-    "% Alert Reduction", 
-    0, 100, 
-    value=template.get("alert_reduction_pct", 0),
-    key="alert_reduction_pct"
-)
-alert_triage_time_saved_pct = st.sidebar.slider(
-    "% Alert Triage Time Reduction", 
-    0, 100, 0,
-    key="alert_triage_time_saved_pct"
-)
+    # Calculate and display total working hours
+    total_working_days = (weeks_per_year * days_per_week) - holiday_sick_days
+    working_hours_per_fte_per_year = total_working_days * hours_per_day
+    st.info(f"**Calculated: {working_hours_per_fte_per_year:,.0f} working hours per FTE per year**")
+
+    # --- ALERT INPUTS ---
+    st.subheader("🚨 Alert Management")
+    alert_volume = st.number_input(
+        "Total Infrastructure Related Alerts Managed per Year", 
+        value=template.get("alert_volume", 0),
+        key="alert_volume"
+    )
+    alert_ftes = st.number_input(
+        "Total FTEs Managing Infrastructure Alerts", 
+        value=0,
+        key="alert_ftes"
+    )
+    alert_fte_time_pct = st.slider(
+        "% of FTE Time on Alerts", 0, 100, 100,
+        help="The percentage of time the above FTEs dedicate specifically to managing these alerts.",
+        key="alert_fte_time_pct"
+    )
+    avg_alert_triage_time = st.number_input(
+        "Average Alert Triage Time (minutes)", 
+        value=template.get("avg_alert_triage_time", 0),
+        key="avg_alert_triage_time"
+    )
+    avg_alert_fte_salary = st.number_input(
+        "Average Annual Salary per Alert Management FTE", 
+        value=0,
+        key="avg_alert_fte_salary"
+    )
+    alert_reduction_pct = st.slider(
+        "% Alert Reduction", 
+        0, 100, 
+        value=template.get("alert_reduction_pct", 0),
+        key="alert_reduction_pct"
+    )
+    alert_triage_time_saved_pct = st.slider(
+        "% Alert Triage Time Reduction", 
+        0, 100, 0,
+        key="alert_triage_time_saved_pct"
+    )
 
-# --- INCIDENT INPUTS ---
-st.sidebar.subheader("🔧 Incident Management")
-incident_volume = st.sidebar.number_input(
-    "Total Infrastructure Related Incident Volumes Managed per Year", 
-    value=template.get("incident_volume", 0),
-    key="incident_volume"
-)
-incident_ftes = st.sidebar.number_input(
-    "Total FTEs Managing Infrastructure Incidents", 
-    value=0,
-    key="incident_ftes"
-)
-incident_fte_time_pct = st.sidebar.slider(
-    "% of FTE Time on Incidents", 0, 100, 100,
-    help="The percentage of time the above FTEs dedicate specifically to managing these incidents.",
-    key="incident_fte_time_pct"
-)
-avg_incident_triage_time = st.sidebar.number_input(
-    "Average Incident Triage Time (minutes)", 
-    value=template.get("avg_incident_triage_time", 0),
-    key="avg_incident_triage_time"
-)
-avg_incident_fte_salary = st.sidebar.number_input(
-    "Average Annual Salary per Incident Management FTE", 
-    value=0,
-    key="avg_incident_fte_salary"
-)
-incident_reduction_pct = st.sidebar.slider(
-    "% Incident Reduction", 
-    0, 100, 
-    value=template.get("incident_reduction_pct", 0),
-    key="incident_reduction_pct"
-)
-incident_triage_time_savings_pct = st.sidebar.slider(
-    "% Incident Triage Time Reduction", 
-    0, 100, 0,
-    key="incident_triage_time_savings_pct"
-)
+    # --- INCIDENT INPUTS ---
+    st.subheader("🔧 Incident Management")
+    incident_volume = st.number_input(
+        "Total Infrastructure Related Incident Volumes Managed per Year", 
+        value=template.get("incident_volume", 0),
+        key="incident_volume"
+    )
+    incident_ftes = st.number_input(
+        "Total FTEs Managing Infrastructure Incidents", 
+        value=0,
+        key="incident_ftes"
+    )
+    incident_fte_time_pct = st.slider(
+        "% of FTE Time on Incidents", 0, 100, 100,
+        help="The percentage of time the above FTEs dedicate specifically to managing these incidents.",
+        key="incident_fte_time_pct"
+    )
+    avg_incident_triage_time = st.number_input(
+        "Average Incident Triage Time (minutes)", 
+        value=template.get("avg_incident_triage_time", 0),
+        key="avg_incident_triage_time"
+    )
+    avg_incident_fte_salary = st.number_input(
+        "Average Annual Salary per Incident Management FTE", 
+        value=0,
+        key="avg_incident_fte_salary"
+    )
+    incident_reduction_pct = st.slider(
+        "% Incident Reduction", 
+        0, 100, 
+        value=template.get("incident_reduction_pct", 0),
+        key="incident_reduction_pct"
+    )
+    incident_triage_time_savings_pct = st.slider(
+        "% Incident Triage Time Reduction", 
+        0, 100, 0,
+        key="incident_triage_time_savings_pct"
+    )
 
-# --- MAJOR INCIDENT INPUTS ---
-st.sidebar.subheader("🚨 Major Incidents (Sev1)")
-major_incident_volume = st.sidebar.number_input(
-    "Total Infrastructure Related Major Incidents per Year (Sev1)", 
-    value=template.get("major_incident_volume", 0),
-    key="major_incident_volume"
-)
-avg_major_incident_cost = st.sidebar.number_input(
-    "Average Major Incident Cost per Hour", 
-    value=0,
-    key="avg_major_incident_cost"
-)
-avg_mttr_hours = st.sidebar.number_input(
-    "Average MTTR (hours)", 
-    value=0.0,
-    key="avg_mttr_hours"
-)
-mttr_improvement_pct = st.sidebar.slider(
-    "MTTR Improvement Percentage", 
-    0, 100, 
-    value=template.get("mttr_improvement_pct", 0),
-    key="mttr_improvement_pct"
-)
+    # --- MAJOR INCIDENT INPUTS ---
+    st.subheader("🚨 Major Incidents (Sev1)")
+    major_incident_volume = st.number_input(
+        "Total Infrastructure Related Major Incidents per Year (Sev1)", 
+        value=template.get("major_incident_volume", 0),
+        key="major_incident_volume"
+    )
+    avg_major_incident_cost = st.number_input(
+        "Average Major Incident Cost per Hour", 
+        value=0,
+        key="avg_major_incident_cost"
+    )
+    avg_mttr_hours = st.number_input(
+        "Average MTTR (hours)", 
+        value=0.0,
+        key="avg_mttr_hours"
+    )
+    mttr_improvement_pct = st.slider(
+        "MTTR Improvement Percentage", 
+        0, 100, 
+        value=template.get("mttr_improvement_pct", 0),
+        key="mttr_improvement_pct"
+    )
 
-# --- ASSET DISCOVERY INPUTS ---
-st.sidebar.subheader("🏗️ Asset Discovery")
+    # --- ASSET DISCOVERY INPUTS ---
+    st.subheader("🏗️ Asset Discovery")
 
-# Asset Discovery Automation
-st.sidebar.markdown("**Asset Discovery Automation**")
-asset_volume = st.sidebar.number_input(
-    "Total IT Assets Under Management", 
-    value=template.get("asset_volume", 0),
-    key="asset_volume",
-    help="Total number of IT assets (servers, network devices, applications, etc.)"
-)
-manual_discovery_cycles_per_year = st.sidebar.number_input(
-    "Manual Discovery Cycles per Year", 
-    value=template.get("manual_discovery_cycles_per_year", 0),
-    key="manual_discovery_cycles_per_year",
-    help="How often you manually discover/audit your IT assets"
-)
-hours_per_discovery_cycle = st.sidebar.number_input(
-    "Hours per Manual Discovery Cycle", 
-    value=template.get("hours_per_discovery_cycle", 0),
-    key="hours_per_discovery_cycle",
-    help="Total FTE hours spent on each manual discovery cycle"
-)
-asset_management_ftes = st.sidebar.number_input(
-    "Total FTEs Managing IT Assets", 
-    value=0,
-    key="asset_management_ftes",
-    help="FTEs involved in asset discovery"
-)
-asset_mgmt_fte_time_pct = st.sidebar.slider(
-    "% of FTE Time on Asset Discovery", 0, 100, 100,
-    help="The percentage of time the above FTEs dedicate to manual asset discovery.",
-    key="asset_mgmt_fte_time_pct"
-)
-avg_asset_mgmt_fte_salary = st.sidebar.number_input(
-    "Average Annual Salary per Asset Management FTE", 
-    value=0,
-    key="avg_asset_mgmt_fte_salary"
-)
-asset_discovery_automation_pct = st.sidebar.slider(
-    "% Asset Discovery Process Automated", 
-    0, 100, template.get("asset_discovery_automation_pct", 0),
-    key="asset_discovery_automation_pct",
-    help="Percentage of manual discovery process that can be automated"
-)
+    # Asset Discovery Automation
+    st.markdown("**Asset Discovery Automation**")
+    asset_volume = st.number_input(
+        "Total IT Assets Under Management", 
+        value=template.get("asset_volume", 0),
+        key="asset_volume",
+        help="Total number of IT assets (servers, network devices, applications, etc.)"
+    )
+    manual_discovery_cycles_per_year = st.number_input(
+        "Manual Discovery Cycles per Year", 
+        value=template.get("manual_discovery_cycles_per_year", 0),
+        key="manual_discovery_cycles_per_year",
+        help="How often you manually discover/audit your IT assets"
+    )
+    hours_per_discovery_cycle = st.number_input(
+        "Hours per Manual Discovery Cycle", 
+        value=template.get("hours_per_discovery_cycle", 0),
+        key="hours_per_discovery_cycle",
+        help="Total FTE hours spent on each manual discovery cycle"
+    )
+    asset_management_ftes = st.number_input(
+        "Total FTEs Managing IT Assets", 
+        value=0,
+        key="asset_management_ftes",
+        help="FTEs involved in asset discovery"
+    )
+    asset_mgmt_fte_time_pct = st.slider(
+        "% of FTE Time on Asset Discovery", 0, 100, 100,
+        help="The percentage of time the above FTEs dedicate to manual asset discovery.",
+        key="asset_mgmt_fte_time_pct"
+    )
+    avg_asset_mgmt_fte_salary = st.number_input(
+        "Average Annual Salary per Asset Management FTE", 
+        value=0,
+        key="avg_asset_mgmt_fte_salary"
+    )
+    asset_discovery_automation_pct = st.slider(
+        "% Asset Discovery Process Automated", 
+        0, 100, template.get("asset_discovery_automation_pct", 0),
+        key="asset_discovery_automation_pct",
+        help="Percentage of manual discovery process that can be automated"
+    )
 
-# --- OTHER BENEFITS ---
-st.sidebar.subheader("💰 Additional Benefits")
-tool_savings = st.sidebar.number_input(
-    "Tool Consolidation Savings", 
-    value=0,
-    key="tool_savings"
-)
-people_cost_per_year = st.sidebar.number_input(
-    "People Efficiency Gains", 
-    value=0,
-    key="people_efficiency"
-)
-fte_avoidance = st.sidebar.number_input(
-    "FTE Avoidance (annualized value in local currency)", 
-    value=0,
-    key="fte_avoidance"
-)
-sla_penalty_avoidance = st.sidebar.number_input(
-    "SLA Penalty Avoidance (Service Providers)", 
-    value=0,
-    key="sla_penalty"
-)
-revenue_growth = st.sidebar.number_input(
-    "Revenue Growth (Service Providers)", 
-    value=0,
-    key="revenue_growth"
-)
-capex_savings = st.sidebar.number_input(
-    "Capital Expenditure Savings (Hardware)", 
-    value=0,
-    key="capex_savings"
-)
-opex_savings = st.sidebar.number_input(
-    "Operational Expenditure Savings (e.g. Storage Costs)", 
-    value=0,
-    key="opex_savings"
-)
+    # --- OTHER BENEFITS ---
+    st.subheader("💰 Additional Benefits")
+    tool_savings = st.number_input(
+        "Tool Consolidation Savings", 
+        value=0,
+        key="tool_savings"
+    )
+    people_cost_per_year = st.number_input(
+        "People Efficiency Gains", 
+        value=0,
+        key="people_efficiency"
+    )
+    fte_avoidance = st.number_input(
+        "FTE Avoidance (annualized value in local currency)", 
+        value=0,
+        key="fte_avoidance"
+    )
+    sla_penalty_avoidance = st.number_input(
+        "SLA Penalty Avoidance (Service Providers)", 
+        value=0,
+        key="sla_penalty"
+    )
+    revenue_growth = st.number_input(
+        "Revenue Growth (Service Providers)", 
+        value=0,
+        key="revenue_growth"
+    )
+    capex_savings = st.number_input(
+        "Capital Expenditure Savings (Hardware)", 
+        value=0,
+        key="capex_savings"
+    )
+    opex_savings = st.number_input(
+        "Operational Expenditure Savings (e.g. Storage Costs)", 
+        value=0,
+        key="opex_savings"
+    )
 
-# --- COSTS ---
-st.sidebar.subheader("💳 Solution Costs")
-platform_cost = st.sidebar.number_input(
-    "Annual Subscription Cost (After discounts)", 
-    value=0,
-    key="platform_cost"
-)
-services_cost = st.sidebar.number_input(
-    "Implementation & Services (One-Time)", 
-    value=0,
-    key="services_cost"
-)
+    # --- COSTS ---
+    st.subheader("💳 Solution Costs")
+    platform_cost = st.number_input(
+        "Annual Subscription Cost (After discounts)", 
+        value=0,
+        key="platform_cost"
+    )
+    services_cost = st.number_input(
+        "Implementation & Services (One-Time)", 
+        value=0,
+        key="services_cost"
+    )
 
-# --- FINANCIAL SETTINGS ---
-st.sidebar.subheader("📊 Financial Analysis Settings")
-evaluation_years = st.sidebar.slider(
-    "Evaluation Period (Years)", 
-    1, 5, 3,
-    key="evaluation_years"
-)
-discount_rate = st.sidebar.slider(
-    "NPV Discount Rate (%)", 
-    0, 20, 3,
-    key="discount_rate"
-) / 100
+    # --- FINANCIAL SETTINGS ---
+    st.subheader("📊 Financial Analysis Settings")
+    evaluation_years = st.slider(
+        "Evaluation Period (Years)", 
+        1, 5, 3,
+        key="evaluation_years"
+    )
+    discount_rate = st.slider(
+        "NPV Discount Rate (%)", 
+        0, 20, 3,
+        key="discount_rate"
+    ) / 100
+
+    if st.form_submit_button("Apply", type="primary"):
+        # Manual edits diverge from the last imported file, so allow re-importing it
+        st.session_state.pop('_last_cfg_hash', None)
 
 # --- INPUT VALIDATION ---
 st.sidebar.markdown("---")
@@ -2500,30 +2691,21 @@ asset_discovery_savings = total_discovery_cost * (asset_discovery_automation_pct
 # Store calculated values in session state for use in other functions
 st.session_state['cost_per_alert'] = cost_per_alert
 st.session_state['cost_per_incident'] = cost_per_incident
-st.session_state['total_alert_handling_cost'] = total_alert_handling_cost
-st.session_state['total_incident_handling_cost'] = total_incident_handling_cost
 st.session_state['alert_fte_percentage'] = alert_fte_percentage
 st.session_state['incident_fte_percentage'] = incident_fte_percentage
 st.session_state['working_hours_per_fte_per_year'] = working_hours_per_fte_per_year
 
 # Store asset management calculated values in session state (no CMDB)
-st.session_state['cost_per_discovery_cycle'] = cost_per_discovery_cycle
-st.session_state['total_discovery_cost'] = total_discovery_cost
-st.session_state['discovery_fte_percentage'] = discovery_fte_percentage
 st.session_state['asset_discovery_savings'] = asset_discovery_savings
 
 # Calculate baseline savings
-avoided_alerts = alert_volume * (alert_reduction_pct / 100)
-remaining_alerts = alert_volume - avoided_alerts
-alert_reduction_savings = avoided_alerts * cost_per_alert
-remaining_alert_handling_cost = remaining_alerts * cost_per_alert
-alert_triage_savings = remaining_alert_handling_cost * (alert_triage_time_saved_pct / 100)
-
-avoided_incidents = incident_volume * (incident_reduction_pct / 100)
-remaining_incidents = incident_volume - avoided_incidents
-incident_reduction_savings = avoided_incidents * cost_per_incident
-remaining_incident_handling_cost = remaining_incidents * cost_per_incident
-incident_triage_savings = remaining_incident_handling_cost * (incident_triage_time_savings_pct / 100)
+avoided_alerts, remaining_alerts, alert_reduction_savings, alert_triage_savings = calculate_volume_savings(
+    alert_volume, alert_reduction_pct, cost_per_alert, alert_triage_time_saved_pct
+)
+
+avoided_incidents, remaining_incidents, incident_reduction_savings, incident_triage_savings = calculate_volume_savings(
+    incident_volume, incident_reduction_pct, cost_per_incident, incident_triage_time_savings_pct
+)
 
 mttr_hours_saved_per_incident = (mttr_improvement_pct / 100) * avg_mttr_hours
 total_mttr_hours_saved = major_incident_volume * mttr_hours_saved_per_incident
@@ -2552,21 +2734,21 @@ scenarios = {
     "Conservative": {
         "benefits_multiplier": 0.7,  # 30% lower benefits
         "implementation_delay_multiplier": 1.3,  # 30% longer implementation
-        "description": "Benefits 30% lower, implementation 30% longer",
+        "description": SCENARIO_DESCRIPTIONS["Conservative"],
         "color": "#ff6b6b",
         "icon": "🔴"
     },
     "Expected": {
         "benefits_multiplier": 1.0,  # Baseline
         "implementation_delay_multiplier": 1.0,  # Baseline
-        "description": "Baseline assumptions as entered",
+        "description": SCENARIO_DESCRIPTIONS["Expected"],
         "color": "#4ecdc4",
         "icon": "🟢"
     },
     "Optimistic": {
         "benefits_multiplier": 1.2,  # 20% higher benefits
         "implementation_delay_multiplier": 0.8,  # 20% faster implementation
-        "description": "Benefits 20% higher, implementation 20% faster",
+        "description": SCENARIO_DESCRIPTIONS["Optimistic"],
         "color": "#45b7d1",
         "icon": "🔵"
     }
@@ -2578,13 +2760,32 @@ for scenario_name, params in scenarios.items():
         params["benefits_multiplier"], 
         params["implementation_delay_multiplier"],
         scenario_name,
-        billing_start_month
+        billing_start_month,
+        total_annual_benefits,
+        implementation_delay_months,
+        benefits_ramp_up_months,
+        platform_cost,
+        services_cost,
+        evaluation_years,
+        discount_rate
     )
-    scenario_results[scenario_name].update({
+    s_result = scenario_results[scenario_name]
+    s_result.update({
         "color": params["color"],
         "description": params["description"],
         "icon": params["icon"]
     })
+    
+    # Monthly payback, reusing the scenario's adjusted benefits and implementation delay
+    s_result['payback_months'] = calculate_payback_months(
+        annual_benefits=s_result['annual_benefits'],
+        annual_platform_cost=platform_cost,
+        one_time_services_cost=services_cost,
+        implementation_delay_months=s_result['impl_delay'],
+        benefits_ramp_up_months=benefits_ramp_up_months,
+        billing_start_month=billing_start_month,
+        max_months_eval=evaluation_years * 12
+    )
 
 # Store scenario results in session state for PDF generation
 st.session_state['scenario_results'] = scenario_results
@@ -2615,22 +2816,17 @@ if effective_avg_fte_salary > 0:
 
 st.session_state['equivalent_ftes_from_savings'] = equivalent_ftes_from_savings
 
-# Update scenario results with monthly payback for each scenario
-for scenario_name, params in scenarios.items():
-    s_result = scenario_results[scenario_name]
-    
-    scenario_annual_benefits_for_payback = total_annual_benefits * params["benefits_multiplier"]
-    scenario_impl_delay_for_payback = max(0, int(implementation_delay_months * params["implementation_delay_multiplier"]))
-    
-    s_result['payback_months'] = calculate_payback_months(
-        annual_benefits=scenario_annual_benefits_for_payback,
-        annual_platform_cost=platform_cost,
-        one_time_services_cost=services_cost,
-        implementation_delay_months=scenario_impl_delay_for_payback,
-        benefits_ramp_up_months=benefits_ramp_up_months,
-        billing_start_month=billing_start_month,
-        max_months_eval=evaluation_years * 12
-    )
+# The Expected scenario drives the headline metrics and the calculation tabs
+expected_result = scenario_results['Expected']
+expected_cash_flows = expected_result['cash_flows']
+expected_roi = expected_result['roi'] * 100
+
+# Headline amounts reused across the tabs and the summary, formatted once per rerun
+expected_npv_display = f"{currency_symbol}{expected_result['npv']:,.0f}"
+total_cost_display = f"{currency_symbol}{expected_result['total_cost']:,.0f}"
+total_platform_cost_display = f"{currency_symbol}{expected_result['total_platform_cost']:,.0f}"
+total_annual_benefits_display = f"{currency_symbol}{total_annual_benefits:,.0f}"
+services_cost_display = f"{currency_symbol}{services_cost:,.0f}"
 
 # --- Main App Layout ---
 st.title(f"Autonomous IT Operations Business Value Assessment for {solution_name} Implementation")
@@ -2650,18 +2846,16 @@ st.header("📊 Executive Financial Summary")
 col1, col2, col3 = st.columns(3)
 
 with col1:
-    expected_npv = scenario_results['Expected']['npv']
     st.metric(label=f"Expected NPV ({evaluation_years} years)",
-              value=f"{currency_symbol}{expected_npv:,.0f}")
+              value=expected_npv_display)
     
 with col2:
-    expected_roi = scenario_results['Expected']['roi'] * 100
     st.metric(label=f"Expected ROI ({evaluation_years} years)",
               value=f"{expected_roi:.1f}%")
 
 with col3:
-    expected_payback = scenario_results['Expected']['payback']
-    expected_payback_months = scenario_results['Expected']['payback_months']
+    expected_payback = expected_result['payback']
+    expected_payback_months = expected_result['payback_months']
     st.metric(label="Payback Period",
               value=f"{expected_payback_months}")
 
@@ -2690,8 +2884,8 @@ with calc_tabs[0]:
     st.subheader("📐 ROI Calculation Formula")
     
     # Display the ROI formula with actual numbers
-    total_benefits_3yr = sum([cf['benefits'] for cf in scenario_results['Expected']['cash_flows']])
-    total_costs_3yr = sum([cf['platform_cost'] + cf['services_cost'] for cf in scenario_results['Expected']['cash_flows']])
+    total_benefits_3yr = expected_result['total_benefits']
+    total_costs_3yr = expected_result['total_cost']
     simple_roi = ((total_benefits_3yr - total_costs_3yr) / total_costs_3yr) * 100 if total_costs_3yr > 0 else 0
     
     col1, col2 = st.columns(2)
@@ -2705,7 +2899,7 @@ with calc_tabs[0]:
         
         **Your Numbers:**
         - **Total Benefits ({evaluation_years} years):** {currency_symbol}{total_benefits_3yr:,.0f}
-        - **Total Costs ({evaluation_years} years):** {currency_symbol}{total_costs_3yr:,.0f}
+        - **Total Costs ({evaluation_years} years):** {total_cost_display}
         - **Net Benefit:** {currency_symbol}{total_benefits_3yr - total_costs_3yr:,.0f}
         - **Simple ROI:** {simple_roi:.1f}%
         """)
@@ -2718,9 +2912,9 @@ with calc_tabs[0]:
         ```
         
         **Your NPV-Based ROI:**
-        - **Net Present Value:** {currency_symbol}{scenario_results['Expected']['npv']:,.0f}
-        - **Total Investment:** {currency_symbol}{total_costs_3yr:,.0f}
-        - **NPV-Based ROI:** {scenario_results['Expected']['roi']*100:.1f}%
+        - **Net Present Value:** {expected_npv_display}
+        - **Total Investment:** {total_cost_display}
+        - **NPV-Based ROI:** {expected_roi:.1f}%
         
         **Why NPV-Based ROI is Better:**
         - Accounts for time value of money (discount rate: {discount_rate*100:.1f}%)
@@ -2746,35 +2940,18 @@ with calc_tabs[1]:
     
     st.markdown("### How We Calculate Your NPV and ROI:")
     
-    # Create detailed calculation table
-    calc_data = []
-    npv_running_total = 0
-    
-    for i, cf in enumerate(scenario_results['Expected']['cash_flows']):
-        present_value = cf['net_cash_flow'] / ((1 + discount_rate) ** cf['year'])
-        npv_running_total += present_value
-        
-        calc_data.append({
-            'Year': cf['year'],
-            'Benefits': f"{currency_symbol}{cf['benefits']:,.0f}",
-            'Platform Cost': f"{currency_symbol}{cf['platform_cost']:,.0f}",
-            'Services Cost': f"{currency_symbol}{cf['services_cost']:,.0f}",
-            'Net Cash Flow': f"{currency_symbol}{cf['net_cash_flow']:,.0f}",
-            'Discount Factor': f"1/(1.{int(discount_rate*100):02d})^{cf['year']} = {1/((1+discount_rate)**cf['year']):.3f}",
-            'Present Value': f"{currency_symbol}{present_value:,.0f}",
-            'Cumulative NPV': f"{currency_symbol}{npv_running_total:,.0f}"
-        })
-    
-    calc_df = pd.DataFrame(calc_data)
+    # Create detailed calculation table (cached, so unchanged reruns reuse the formatted frame)
+    calc_df = create_npv_calculation_table(expected_cash_flows, expected_result['discount_factors'],
+                                           expected_result['present_values'], discount_rate, currency_symbol)
     st.dataframe(calc_df, hide_index=True, use_container_width=True)
     
     col1, col2 = st.columns(2)
     with col1:
-        st.metric("Final NPV", f"{currency_symbol}{scenario_results['Expected']['npv']:,.0f}")
-        st.metric("Total Investment", f"{currency_symbol}{total_costs_3yr:,.0f}")
+        st.metric("Final NPV", expected_npv_display)
+        st.metric("Total Investment", total_cost_display)
     with col2:
-        st.metric("NPV-Based ROI", f"{scenario_results['Expected']['roi']*100:.1f}%")
-        st.metric("Payback Period", scenario_results['Expected']['payback_months'])
+        st.metric("NPV-Based ROI", f"{expected_roi:.1f}%")
+        st.metric("Payback Period", expected_result['payback_months'])
 
 with calc_tabs[2]:
     st.subheader("💰 Detailed Benefit Breakdown")
@@ -2872,27 +3049,26 @@ with calc_tabs[2]:
     if other_benefits_total > 0:
         st.markdown("#### 💰 Additional Benefits")
         
-        additional_benefits_data = []
-        if tool_savings > 0:
-            additional_benefits_data.append(("Tool Consolidation Savings", tool_savings, "Reduction in tool licensing and maintenance costs"))
-        if people_cost_per_year > 0:
-            additional_benefits_data.append(("People Efficiency Gains", people_cost_per_year, "Productivity improvements and efficiency gains"))
-        if fte_avoidance > 0:
-            additional_benefits_data.append(("FTE Avoidance", fte_avoidance, "Cost avoidance from not hiring additional staff"))
-        if sla_penalty_avoidance > 0:
-            additional_benefits_data.append(("SLA Penalty Avoidance", sla_penalty_avoidance, "Avoided penalties from improved service levels"))
-        if revenue_growth > 0:
-            additional_benefits_data.append(("Revenue Growth", revenue_growth, "Additional revenue from improved service delivery"))
-        if capex_savings > 0:
-            additional_benefits_data.append(("CAPEX Savings", capex_savings, "Reduced capital expenditure requirements"))
-        if opex_savings > 0:
-            additional_benefits_data.append(("OPEX Savings", opex_savings, "Operational expenditure reductions"))
+        additional_benefits_data = [
+            (name, value, description)
+            for name, value, description in (
+                ("Tool Consolidation Savings", tool_savings, "Reduction in tool licensing and maintenance costs"),
+                ("People Efficiency Gains", people_cost_per_year, "Productivity improvements and efficiency gains"),
+                ("FTE Avoidance", fte_avoidance, "Cost avoidance from not hiring additional staff"),
+                ("SLA Penalty Avoidance", sla_penalty_avoidance, "Avoided penalties from improved service levels"),
+                ("Revenue Growth", revenue_growth, "Additional revenue from improved service delivery"),
+                ("CAPEX Savings", capex_savings, "Reduced capital expenditure requirements"),
+                ("OPEX Savings", opex_savings, "Operational expenditure reductions"),
+            )
+            if value > 0
+        ]
         
-        for benefit_name, benefit_value, benefit_description in additional_benefits_data:
-            st.markdown(f"""
-            **{benefit_name}:** {currency_symbol}{benefit_value:,.0f}  
-            *{benefit_description}*
-            """)
+        benefit_names, benefit_values, benefit_descriptions = zip(*additional_benefits_data)
+        st.dataframe(pd.DataFrame({
+            'Benefit': benefit_names,
+            'Annual Value': format_currency_values(benefit_values, currency_symbol),
+            'Description': benefit_descriptions
+        }), hide_index=True, use_container_width=True)
 
     # Total Benefits Summary
     st.markdown("#### 📊 Total Benefits Summary")
@@ -2909,7 +3085,7 @@ with calc_tabs[2]:
     with col3:
         st.metric("Additional Benefits", f"{currency_symbol}{other_benefits_total:,.0f}")
     
-    st.markdown(f"**🎯 Total Annual Benefits: {currency_symbol}{total_annual_benefits:,.0f}**")
+    st.markdown(f"**🎯 Total Annual Benefits: {total_annual_benefits_display}**")
     
     # Before/After Comparison Table
     st.markdown("#### 📊 Before vs After Operational Comparison")
@@ -2924,36 +3100,35 @@ with calc_tabs[3]:
     
     col1, col2 = st.columns(2)
     
+    year_labels = tuple(f"Year {year}" for year in expected_cash_flows['year'])
+    platform_cost_lines = "\n".join(
+        f"        - {label}: {currency_symbol}{cost:,.0f}"
+        for label, cost in zip(year_labels, expected_cash_flows['platform_cost'])
+    )
+    
     with col1:
         st.markdown(f"""
         **Annual Platform Costs:**
-        - Year 1: {currency_symbol}{scenario_results['Expected']['cash_flows'][0]['platform_cost']:,.0f}
-        - Year 2: {currency_symbol}{scenario_results['Expected']['cash_flows'][1]['platform_cost']:,.0f}
-        - Year 3: {currency_symbol}{scenario_results['Expected']['cash_flows'][2]['platform_cost']:,.0f}
-        - **Total Platform Costs: {currency_symbol}{sum([cf['platform_cost'] for cf in scenario_results['Expected']['cash_flows']]):,.0f}**
+{platform_cost_lines}
+        - **Total Platform Costs: {total_platform_cost_display}**
         """)
     
     with col2:
         st.markdown(f"""
         **One-Time Costs:**
-        - Implementation & Services: {currency_symbol}{services_cost:,.0f}
-        - **Total One-Time Costs: {currency_symbol}{services_cost:,.0f}**
+        - Implementation & Services: {services_cost_display}
+        - **Total One-Time Costs: {services_cost_display}**
         
         **Total Investment:**
-        - Platform (3 years): {currency_symbol}{sum([cf['platform_cost'] for cf in scenario_results['Expected']['cash_flows']]):,.0f}
-        - Services (one-time): {currency_symbol}{services_cost:,.0f}
-        - **Total TCO: {currency_symbol}{total_costs_3yr:,.0f}**
+        - Platform ({evaluation_years} years): {total_platform_cost_display}
+        - Services (one-time): {services_cost_display}
+        - **Total TCO: {total_cost_display}**
         """)
 
 with calc_tabs[4]:
     st.subheader("🔄 Interactive ROI Calculator")
     st.info("Adjust the sliders below to see how changes affect your ROI in real-time.")
     
-    # Sync interactive slider values with main configuration values
-    # This ensures imported configurations work properly
-    if 'sync_interactive_sliders' not in st.session_state:
-        st.session_state['sync_interactive_sliders'] = True
-    
     # Get current values from main configuration (respects imported values)
     current_alert_reduction = st.session_state.get('alert_reduction_pct', 0)
     current_incident_reduction = st.session_state.get('incident_reduction_pct', 0)
@@ -2962,36 +3137,47 @@ with calc_tabs[4]:
     current_discount_rate = st.session_state.get('discount_rate', 10)
     current_asset_discovery_automation = st.session_state.get('asset_discovery_automation_pct', 0)
     
+    # Seed each slider from the configuration on first mount only; afterwards the widget keeps its own state
+    for slider_key, initial_value in (
+        ('interactive_alert_reduction', current_alert_reduction),
+        ('interactive_incident_reduction', current_incident_reduction),
+        ('interactive_mttr_improvement', current_mttr_improvement),
+        ('interactive_platform_cost', 1.0),
+        ('interactive_implementation_delay', current_implementation_delay),
+        ('interactive_asset_automation', current_asset_discovery_automation),
+    ):
+        st.session_state.setdefault(slider_key, initial_value)
+    
     # Interactive sliders for key variables
     col1, col2, col3 = st.columns(3)
     
     with col1:
         interactive_alert_reduction = st.slider(
-            "Alert Reduction %", 0, 100, current_alert_reduction,
+            "Alert Reduction %", 0, 100,
             key="interactive_alert_reduction"
         )
         interactive_incident_reduction = st.slider(
-            "Incident Reduction %", 0, 100, current_incident_reduction,
+            "Incident Reduction %", 0, 100,
             key="interactive_incident_reduction"
         )
     
     with col2:
         interactive_mttr_improvement = st.slider(
-            "MTTR Improvement %", 0, 100, current_mttr_improvement,
+            "MTTR Improvement %", 0, 100,
             key="interactive_mttr_improvement"
         )
         interactive_platform_cost_mult = st.slider(
-            "Platform Cost Multiplier", 0.5, 2.0, 1.0, 0.1,
+            "Platform Cost Multiplier", 0.5, 2.0, step=0.1,
             key="interactive_platform_cost"
         )
     
     with col3:
         interactive_implementation_delay = st.slider(
-            "Implementation Delay (months)", 1, 24, current_implementation_delay,
+            "Implementation Delay (months)", 0, 24,
             key="interactive_implementation_delay"
         )
         interactive_asset_automation = st.slider(
-            "Asset Discovery Automation %", 0, 100, current_asset_discovery_automation,
+            "Asset Discovery Automation %", 0, 100,
             key="interactive_asset_automation"
         )
     
@@ -3010,18 +3196,14 @@ with calc_tabs[4]:
     
     # Calculate interactive results (CORRECTED to match original calculation method)
     # Alert savings - both reduction and triage efficiency
-    interactive_avoided_alerts = alert_volume * (interactive_alert_reduction / 100)
-    interactive_remaining_alerts = alert_volume - interactive_avoided_alerts
-    interactive_alert_reduction_savings = interactive_avoided_alerts * cost_per_alert
-    interactive_remaining_alert_handling_cost = interactive_remaining_alerts * cost_per_alert
-    interactive_alert_triage_savings = interactive_remaining_alert_handling_cost * (alert_triage_time_saved_pct / 100)
+    _, _, interactive_alert_reduction_savings, interactive_alert_triage_savings = calculate_volume_savings(
+        alert_volume, interactive_alert_reduction, cost_per_alert, alert_triage_time_saved_pct
+    )
     
     # Incident savings - both reduction and triage efficiency  
-    interactive_avoided_incidents = incident_volume * (interactive_incident_reduction / 100)
-    interactive_remaining_incidents = incident_volume - interactive_avoided_incidents
-    interactive_incident_reduction_savings = interactive_avoided_incidents * cost_per_incident
-    interactive_remaining_incident_handling_cost = interactive_remaining_incidents * cost_per_incident
-    interactive_incident_triage_savings = interactive_remaining_incident_handling_cost * (incident_triage_time_savings_pct / 100)
+    _, _, interactive_incident_reduction_savings, interactive_incident_triage_savings = calculate_volume_savings(
+        incident_volume, interactive_incident_reduction, cost_per_incident, incident_triage_time_savings_pct
+    )
     
     # MTTR savings
     interactive_mttr_savings = major_incident_volume * (interactive_mttr_improvement / 100) * avg_mttr_hours * avg_major_incident_cost
@@ -3037,52 +3219,31 @@ with calc_tabs[4]:
                                 capex_savings + opex_savings + interactive_asset_discovery_savings)
     
     # Calculate interactive NPV using the SAME method as original (accounts for billing timing)
-    interactive_cash_flows = []
-    for year in range(1, evaluation_years + 1):
-        year_start_month = (year - 1) * 12 + 1
-        year_end_month = year * 12
-        
-        # Calculate monthly factors and average for the year (same as original)
-        monthly_benefit_factors = []
-        monthly_cost_factors = []
-        
-        for month in range(year_start_month, year_end_month + 1):
-            benefit_factor = calculate_benefit_realization_factor(month, interactive_implementation_delay, benefits_ramp_up_months)
-            cost_factor = calculate_platform_cost_factor(month, billing_start_month)
-            monthly_benefit_factors.append(benefit_factor)
-            monthly_cost_factors.append(cost_factor)
-        
-        avg_benefit_realization_factor = np.mean(monthly_benefit_factors)
-        avg_cost_factor = np.mean(monthly_cost_factors)
-        
-        year_benefits = interactive_total_benefits * avg_benefit_realization_factor
-        year_platform_cost = platform_cost * interactive_platform_cost_mult * avg_cost_factor
-        year_services_cost = services_cost if year == 1 else 0
-        year_net_cash_flow = year_benefits - year_platform_cost - year_services_cost
-        
-        interactive_cash_flows.append({
-            'year': year,
-            'benefits': year_benefits,
-            'platform_cost': year_platform_cost,
-            'services_cost': year_services_cost,
-            'net_cash_flow': year_net_cash_flow
-        })
+    if interactive_implementation_delay == expected_result['impl_delay']:
+        # Same timeline as the Expected scenario, so its monthly factors can be reused
+        interactive_benefit_factors = expected_result['monthly_benefit_factors']
+        interactive_cost_factors = expected_result['monthly_cost_factors']
+    else:
+        interactive_benefit_factors, interactive_cost_factors = calculate_monthly_factors(
+            np.arange(1, evaluation_years * 12 + 1), interactive_implementation_delay, benefits_ramp_up_months, billing_start_month)
+    interactive_cash_flows = calculate_yearly_cash_flows(
+        interactive_total_benefits, platform_cost * interactive_platform_cost_mult, services_cost,
+        interactive_benefit_factors, interactive_cost_factors)
     
     # Calculate NPV and total costs using the same method as original
-    interactive_npv = sum([cf['net_cash_flow'] / ((1 + discount_rate) ** cf['year']) for cf in interactive_cash_flows])
-    interactive_total_costs = sum([cf['platform_cost'] + cf['services_cost'] for cf in interactive_cash_flows])
+    interactive_npv = calculate_present_values(interactive_cash_flows, discount_rate)[1].sum()
+    interactive_total_costs = (interactive_cash_flows['platform_cost'] + interactive_cash_flows['services_cost']).sum()
     interactive_roi = (interactive_npv / interactive_total_costs * 100) if interactive_total_costs > 0 else 0
     
     # Display interactive results
     st.markdown("### Interactive Results vs Original")
     
     # Show sync status
-    if (interactive_alert_reduction == current_alert_reduction and 
-        interactive_incident_reduction == current_incident_reduction and
-        interactive_mttr_improvement == current_mttr_improvement and
-        interactive_platform_cost_mult == 1.0 and
-        interactive_implementation_delay == current_implementation_delay and
-        interactive_asset_automation == current_asset_discovery_automation):
+    interactive_settings = (interactive_alert_reduction, interactive_incident_reduction, interactive_mttr_improvement,
+                            interactive_platform_cost_mult, interactive_implementation_delay, interactive_asset_automation)
+    current_settings = (current_alert_reduction, current_incident_reduction, current_mttr_improvement,
+                        1.0, current_implementation_delay, current_asset_discovery_automation)
+    if interactive_settings == current_settings:
         st.success("✅ Sliders match current configuration - results should show 0% change")
     else:
         st.info("ℹ️ Sliders modified from current configuration")
@@ -3090,13 +3251,11 @@ with calc_tabs[4]:
     result_col1, result_col2, result_col3, result_col4 = st.columns(4)
     
     # Use the same calculation method for original values
-    original_total_costs = sum([cf['platform_cost'] + cf['services_cost'] for cf in scenario_results['Expected']['cash_flows']])
-    
     original_values = {
         'benefits': total_annual_benefits,
-        'costs': original_total_costs,
-        'npv': scenario_results['Expected']['npv'],
-        'roi': scenario_results['Expected']['roi'] * 100
+        'costs': expected_result['total_cost'],
+        'npv': expected_result['npv'],
+        'roi': expected_roi
     }
     
     with result_col1:
@@ -3160,12 +3319,11 @@ with calc_tabs[5]:
             st.metric("Positive NPV Probability", f"{positive_npv_pct:.1f}%")
         
         # ROI Distribution Chart
-        fig_roi_dist = px.histogram(
-            x=roi_results, 
-            nbins=50,
+        fig_roi_dist = go.Figure(go.Histogram(x=roi_results, nbinsx=50, opacity=0.7))
+        fig_roi_dist.update_layout(
             title='ROI Distribution from Monte Carlo Simulation',
-            labels={'x': 'ROI (%)', 'y': 'Frequency'},
-            opacity=0.7
+            xaxis_title='ROI (%)',
+            yaxis_title='Frequency'
         )
         fig_roi_dist.add_vline(x=np.median(roi_results), line_dash="dash", line_color="red", 
                                annotation_text=f"Median: {np.median(roi_results):.1f}%")
@@ -3178,49 +3336,44 @@ st.header("📈 Scenario Analysis")
 st.info("Explore the potential financial outcomes under different assumptions.")
 
 tabs = st.tabs(list(scenarios.keys()))
+scenario_summary = create_scenario_summary(scenario_results)
 
 for i, (scenario_name, params) in enumerate(scenarios.items()):
     with tabs[i]:
-        result = scenario_results[scenario_name]
+        summary = scenario_summary.loc[scenario_name]
         st.subheader(f"{params['icon']} {scenario_name} Scenario")
-        st.markdown(f"*{params['description']}*")
-
-        st.markdown("---")
+        st.markdown(f"*{params['description']}*\n\n---")
 
         col1, col2, col3, col4 = st.columns(4)
         with col1:
-            st.metric("Net Present Value (NPV)", f"{currency_symbol}{result['npv']:,.0f}")
+            st.metric("Net Present Value (NPV)", f"{currency_symbol}{summary['npv']:,.0f}")
         with col2:
-            st.metric("Return on Investment (ROI)", f"{result['roi']*100:.1f}%")
+            st.metric("Return on Investment (ROI)", f"{summary['roi']*100:.1f}%")
         with col3:
-            st.metric("Payback Period (Years)", result['payback'])
+            st.metric("Payback Period (Years)", summary['payback'])
         with col4:
-            st.metric("Payback Period (Months)", result['payback_months'])
+            st.metric("Payback Period (Months)", summary['payback_months'])
 
         # Display cash flows in a table
-        st.markdown("#### Detailed Cash Flows")
-        cash_flow_df = pd.DataFrame(result['cash_flows'])
-        cash_flow_df['net_cash_flow_cumulative'] = cash_flow_df['net_cash_flow'].cumsum()
-
-        # Format for display
-        cash_flow_display_df = cash_flow_df.copy()
-        for col in ['benefits', 'platform_cost', 'services_cost', 'net_cash_flow', 'net_cash_flow_cumulative']:
-            cash_flow_display_df[col] = cash_flow_display_df[col].apply(lambda x: f"{currency_symbol}{x:,.0f}")
-        
-        cash_flow_display_df['benefit_realization_factor'] = cash_flow_display_df['benefit_realization_factor'].apply(lambda x: f"{x*100:.1f}%")
-
-        st.dataframe(cash_flow_display_df[[
-            'year', 'benefits', 'platform_cost', 'services_cost', 
-            'net_cash_flow', 'net_cash_flow_cumulative', 'benefit_realization_factor'
-        ]].rename(columns={
-            'year': 'Year',
-            'benefits': 'Benefits',
-            'platform_cost': 'Platform Cost',
-            'services_cost': 'Services Cost',
-            'net_cash_flow': 'Net Cash Flow',
-            'net_cash_flow_cumulative': 'Cumulative Net Cash Flow',
-            'benefit_realization_factor': 'Benefit Realization Factor'
-        }), hide_index=True)
+        with st.expander("Detailed Cash Flows"):
+            cash_flows = scenario_results[scenario_name]['cash_flows']
+            net_cash_flow_cumulative = np.cumsum(cash_flows['net_cash_flow'])
+
+            # Keep the table numeric and let the frontend format it via column_config
+            cash_flow_df = pd.DataFrame({
+                'Year': cash_flows['year'],
+                'Benefits': cash_flows['benefits'],
+                'Platform Cost': cash_flows['platform_cost'],
+                'Services Cost': cash_flows['services_cost'],
+                'Net Cash Flow': cash_flows['net_cash_flow'],
+                'Cumulative Net Cash Flow': net_cash_flow_cumulative,
+                'Benefit Realization Factor': cash_flows['benefit_realization_factor'] * 100
+            })
+            currency_column = st.column_config.NumberColumn(format=f"{currency_symbol}%,.0f")
+            cash_flow_column_config = {column: currency_column for column in cash_flow_df.columns[1:-1]}
+            cash_flow_column_config['Benefit Realization Factor'] = st.column_config.NumberColumn(format="%.1f%%")
+
+            st.dataframe(cash_flow_df, hide_index=True, column_config=cash_flow_column_config)
 
 st.markdown("---")
 
@@ -3256,29 +3409,15 @@ with viz_tabs[2]:
     st.plotly_chart(create_roi_comparison_chart(scenario_results, currency_symbol), use_container_width=True)
 
 with viz_tabs[3]:
-    # Enhanced timeline analysis
-    months_range = list(range(0, evaluation_years * 12 + 1))
-    cumulative_benefits = []
-    cumulative_costs = []
-    cumulative_net = []
-    
-    cum_benefit = 0
-    cum_cost = services_cost  # Initial services cost
-    
-    for month in months_range:
-        if month > 0:
-            benefit_factor = calculate_benefit_realization_factor(month, implementation_delay_months, benefits_ramp_up_months)
-            cost_factor = calculate_platform_cost_factor(month, billing_start_month)
-            
-            monthly_benefit = (total_annual_benefits / 12) * benefit_factor
-            monthly_cost = (platform_cost / 12) * cost_factor
-            
-            cum_benefit += monthly_benefit
-            cum_cost += monthly_cost
-        
-        cumulative_benefits.append(cum_benefit)
-        cumulative_costs.append(cum_cost)
-        cumulative_net.append(cum_benefit - cum_cost)
+    # Enhanced timeline analysis, reusing the Expected scenario's monthly factors
+    # (month 0 carries only the initial services cost)
+    months_range = np.arange(0, evaluation_years * 12 + 1)
+    monthly_benefits = np.concatenate(([0.0], (total_annual_benefits / 12) * expected_result['monthly_benefit_factors']))
+    monthly_costs = np.concatenate(([services_cost], (platform_cost / 12) * expected_result['monthly_cost_factors']))
+    
+    cumulative_benefits = np.cumsum(monthly_benefits)
+    cumulative_costs = np.cumsum(monthly_costs)
+    cumulative_net = cumulative_benefits - cumulative_costs
     
     fig_cumulative = go.Figure()
     
@@ -3320,11 +3459,14 @@ st.subheader("🚀 Value Reallocation & FTE Equivalency")
 col1, col2 = st.columns(2)
 
 with col1:
-    st.write(f"**Cost Available for Higher Margin Projects (Annually):** {currency_symbol}{total_operational_savings_from_time_saved:,.0f}")
     if effective_avg_fte_salary > 0:
-        st.write(f"**Equivalent FTEs from Savings (Annually):** {equivalent_ftes_from_savings:,.1f} FTEs")
+        fte_equivalency_line = f"**Equivalent FTEs from Savings (Annually):** {equivalent_ftes_from_savings:,.1f} FTEs"
     else:
-        st.write("Average FTE salary not provided, unable to calculate equivalent FTEs.")
+        fte_equivalency_line = "Average FTE salary not provided, unable to calculate equivalent FTEs."
+    st.markdown(
+        f"**Cost Available for Higher Margin Projects (Annually):** {currency_symbol}{total_operational_savings_from_time_saved:,.0f}"
+        f"\n\n{fte_equivalency_line}"
+    )
 
 with col2:
     if equivalent_ftes_from_savings > 0:
@@ -3350,10 +3492,10 @@ config_summary = f"""
 - **Benefits Ramp-up:** {benefits_ramp_up_months} months
 
 **Results Summary:**
-- **Expected NPV:** {currency_symbol}{scenario_results['Expected']['npv']:,.0f}
-- **Expected ROI:** {scenario_results['Expected']['roi']*100:.1f}%
-- **Payback Period:** {scenario_results['Expected']['payback_months']}
-- **Annual Benefits:** {currency_symbol}{total_annual_benefits:,.0f}
+- **Expected NPV:** {expected_npv_display}
+- **Expected ROI:** {expected_roi:.1f}%
+- **Payback Period:** {expected_result['payback_months']}
+- **Annual Benefits:** {total_annual_benefits_display}
 - **Asset Discovery Value:** {currency_symbol}{total_asset_mgmt_savings:,.0f}
 - **Equivalent FTEs from Savings:** {equivalent_ftes_from_savings:.1f} FTEs
 """